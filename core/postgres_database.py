@@ -2526,6 +2526,91 @@ class PostgresDatabase:
             print_error(f"Failed to get user list: {e}")
             return []
 
+    def get_user_count(self, min_activity: int = 0) -> int:
+        """Count users meeting minimum activity threshold without loading usernames.
+
+        Args:
+            min_activity: Minimum total posts + comments count (default: 0 = all users)
+
+        Returns:
+            Number of distinct usernames (0 if the query fails)
+        """
+        try:
+            with self.pool.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "SELECT COUNT(DISTINCT username) AS user_count FROM users WHERE total_activity >= %s",
+                        (min_activity,),
+                    )
+                    return cur.fetchone()["user_count"]
+
+        except Exception as e:
+            print_error(f"Failed to count users: {e}")
+            return 0
+
+    def get_user_list_page(
+        self,
+        last_username: str | None,
+        batch_size: int,
+        min_activity: int = 0,
+        subreddit_filter: str | None = None,
+    ) -> list[str]:
+        """Get the next page of usernames using keyset pagination.
+
+        Pages are ordered by username and continue after last_username, so each call
+        is an index range scan of batch_size rows instead of an OFFSET into the full
+        user list. Pass the last username of the previous page to get the next one.
+
+        Args:
+            last_username: Last username of the previous page (None for the first page)
+            batch_size: Maximum number of usernames to return
+            min_activity: Minimum total posts + comments count across the archive
+            subreddit_filter: Optional subreddit to restrict users to. Only users with posts or
+                comments there are returned, matched like get_user_activity_batch(subreddit_filter=...)
+
+        Returns:
+            List of usernames ordered by username (empty when there are no more users)
+        """
+        try:
+            with self.pool.get_connection() as conn:
+                with conn.cursor() as cur:
+                    if subreddit_filter:
+                        subreddit = subreddit_filter.lower()
+                        query = """
+                            SELECT active.author AS username
+                            FROM (
+                                SELECT author FROM posts WHERE subreddit = %s AND author IS NOT NULL
+                                UNION ALL
+                                SELECT author FROM comments WHERE subreddit = %s AND author IS NOT NULL
+                            ) active
+                            JOIN users ON users.username = active.author
+                            WHERE users.total_activity >= %s
+                        """
+                        params = [subreddit, subreddit, min_activity]
+                        if last_username is not None:
+                            query += " AND active.author > %s"
+                            params.append(last_username)
+                        query += " GROUP BY active.author ORDER BY active.author LIMIT %s"
+                    else:
+                        query = """
+                            SELECT DISTINCT username
+                            FROM users
+                            WHERE total_activity >= %s
+                        """
+                        params = [min_activity]
+                        if last_username is not None:
+                            query += " AND username > %s"
+                            params.append(last_username)
+                        query += " ORDER BY username LIMIT %s"
+
+                    params.append(batch_size)
+                    cur.execute(query, params)
+                    return [row["username"] for row in cur]
+
+        except Exception as e:
+            print_error(f"Failed to get user list page: {e}")
+            return []
+
     def stream_user_batches(
         self,
         min_activity: int = 0,
@@ -2788,6 +2873,9 @@ class PostgresDatabase:
         if not usernames:
             return {}
 
+        if subreddit_filter:
+            subreddit_filter = subreddit_filter.lower()
+
         try:
             # Initialize result dictionary for all users
             user_activities = {username: {"posts": [], "comments": [], "all_content": []} for username in usernames}
@@ -2806,7 +2894,7 @@ class PostgresDatabase:
                               AND (NOT %s OR (author != '[deleted]' AND COALESCE(selftext, '') NOT IN ('[deleted]', '[removed]')))
                             ORDER BY author, created_utc DESC
                         """,
-                            (usernames, subreddit_filter.lower(), min_score, min_comments, hide_deleted),
+                            (usernames, subreddit_filter, min_score, min_comments, hide_deleted),
                         )
                     else:
                         # Query posts for all users in batch
@@ -2846,7 +2934,7 @@ class PostgresDatabase:
                               AND (NOT %s OR (body NOT IN ('[deleted]', '[removed]')))
                             ORDER BY author, created_utc DESC
                         """,
-                            (usernames, subreddit_filter.lower(), min_score, hide_deleted),
+                            (usernames, subreddit_filter, min_score, hide_deleted),
                         )
                     else:
                         # Query comments for all users in batch
@@ -2918,6 +3006,39 @@ class PostgresDatabase:
             # Return empty data for all requested users
             return {username: {"posts": [], "comments": [], "all_content": []} for username in usernames}
 
+    def iter_user_activity_batch(
+        self,
+        usernames: list[str],
+        subreddit_filter: str = None,
+        min_score: int = 0,
+        min_comments: int = 0,
+        hide_deleted: bool = False,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (username, user_data) for users in a batch that have content.
+
+        Same queries as get_user_activity_batch(), but users with no content after
+        filtering are skipped, so callers can build their batch in a single pass
+        instead of keeping the result dict and looking each username up in it.
+
+        Args:
+            usernames: List of author usernames to query
+            subreddit_filter: Optional subreddit to filter activity by
+            min_score: Minimum score threshold for posts and comments
+            min_comments: Minimum comment count threshold for posts
+            hide_deleted: Hide deleted/removed comments
+
+        Yields:
+            (username, user_data) tuples in the order of usernames
+        """
+        user_activities = self.get_user_activity_batch(
+            usernames, subreddit_filter, min_score=min_score, min_comments=min_comments, hide_deleted=hide_deleted
+        )
+        # The result dict is built in usernames order, so iterating it directly keeps
+        # that order without a lookup per user
+        for username, user_data in user_activities.items():
+            if user_data["all_content"]:
+                yield username, user_data
+
     def link_posts_to_users(
         self, user_db_path: str, progress_callback: Callable[[dict], None] | None = None
     ) -> dict[str, int]:
@@ -3057,6 +3178,7 @@ class PostgresDatabase:
             "idx_posts_subreddit_created",
             "idx_posts_author",
             "idx_posts_author_subreddit",
+            "idx_posts_subreddit_author",
             "idx_posts_permalink",
             "idx_posts_created_utc_brin",
             "idx_posts_search",
@@ -3068,6 +3190,7 @@ class PostgresDatabase:
             "idx_comments_parent_id",
             "idx_comments_author",
             "idx_comments_author_subreddit",
+            "idx_comments_subreddit_author",
             "idx_comments_subreddit_created",
             "idx_comments_permalink",
             "idx_comments_created_utc_brin",
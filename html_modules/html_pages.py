@@ -292,13 +292,10 @@ def write_user_page_from_db(
     try:
         import time
 
-        from core.postgres_database import PostgresDatabase
         from utils.console_output import create_progress_bar
-        from utils.simple_json_utils import get_archive_database_connection_string, get_user_batches_sqlite
+        from utils.simple_json_utils import get_user_batches_sqlite, get_user_count_sqlite
 
-        connection_string = get_archive_database_connection_string()
-        with PostgresDatabase(connection_string, workload_type="user_processing") as db:
-            total_users = len(db.get_user_list(min_activity))
+        total_users = get_user_count_sqlite(output_dir, min_activity)
 
         start_time = time.time()
         progress_bar = create_progress_bar(total_users, "Generating user pages") if total_users > 0 else None
@@ -339,29 +336,23 @@ def write_user_page_incremental(
 ) -> bool:
     """Incremental user page generation for specific subreddit (uses Jinja2)."""
     try:
-        from core.postgres_database import PostgresDatabase
-        from utils.simple_json_utils import (
-            get_archive_database_connection_string,
-            get_user_batches_for_subreddit_sqlite,
-        )
+        from utils.simple_json_utils import get_user_batches_for_subreddit_sqlite
 
         print(f"Generating user pages for r/{target_subreddit}...")
 
         total_processed = 0
-        connection_string = get_archive_database_connection_string()
 
-        with PostgresDatabase(connection_string, workload_type="user_processing"):
-            for batch in get_user_batches_for_subreddit_sqlite(
-                output_dir, target_subreddit, 50, min_activity, min_score, min_comments, hide_deleted
-            ):
-                for username, user_data in batch:
-                    if write_user_page_streaming(subs, username, user_data, seo_config):
-                        total_processed += 1
-                    del user_data
+        for batch in get_user_batches_for_subreddit_sqlite(
+            output_dir, target_subreddit, 50, min_activity, min_score, min_comments, hide_deleted
+        ):
+            for username, user_data in batch:
+                if write_user_page_streaming(subs, username, user_data, seo_config):
+                    total_processed += 1
+                del user_data
 
-                import gc
+            import gc
 
-                gc.collect()
+            gc.collect()
 
         print(f"✅ User pages complete: {total_processed} users")
         return True
@@ -14,8 +14,9 @@ from utils.console_output import print_error, print_info
 from utils.simple_json_utils import (
     load_search_metadata,
     load_subreddit_stats,
-    save_search_metadata,
-    save_subreddit_stats,
+    merge_and_write_json,
+    merge_search_metadata,
+    merge_subreddit_stats,
 )
 
 
@@ -351,14 +352,13 @@ class IncrementalStatistics:
             print(f"[DEBUG]   - {name}")
 
         try:
-            # Save each subreddit individually to ensure proper merging
+            # Merge all subreddits into the existing file in one read-merge-write
             # This is critical for resume operations to preserve existing data
-            for subreddit_name, stats in self._stats_cache.items():
-                success = save_subreddit_stats(self.output_dir, subreddit_name, stats)
-                if not success:
-                    print(f"[ERROR] Failed to save stats for {subreddit_name}")
-
-            print("[DEBUG] Successfully saved stats for all subreddits")
+            stats_file = os.path.join(self.output_dir, ".archive-subreddit-stats.json")
+            if merge_and_write_json(stats_file, dict(self._stats_cache), merge_subreddit_stats):
+                print("[DEBUG] Successfully saved stats for all subreddits")
+            else:
+                print(f"[ERROR] Failed to save stats for {len(self._stats_cache)} subreddits")
 
         except Exception as e:
             print(f"[ERROR] Error saving statistics to disk: {e}")
@@ -384,14 +384,13 @@ class IncrementalStatistics:
             return  # Skip saving during resume restoration
 
         try:
-            # Save each subreddit's search metadata individually to ensure proper merging
+            # Merge all subreddits' search metadata into the existing file in one read-merge-write
             # This is critical for resume operations to preserve existing data
-            for subreddit_name, metadata in self._search_cache.items():
-                success = save_search_metadata(self.output_dir, subreddit_name, metadata)
-                if not success:
-                    print(f"[ERROR] Failed to save search metadata for {subreddit_name}")
-
-            print("[DEBUG] Successfully saved search metadata for all subreddits")
+            search_file = os.path.join(self.output_dir, ".archive-search-metadata.json")
+            if merge_and_write_json(search_file, dict(self._search_cache), merge_search_metadata):
+                print("[DEBUG] Successfully saved search metadata for all subreddits")
+            else:
+                print(f"[ERROR] Failed to save search metadata for {len(self._search_cache)} subreddits")
 
         except Exception as e:
             print(f"[WARNING] Error saving search metadata to disk: {e}")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""
+ABOUTME: Manual smoke script for the input validation module
+ABOUTME: Prints pass/fail for field and combined validation cases; run from the repo root: python -m scripts.input_validation_smoke
+"""
+
+from utils.input_validation import validator
+
+
+def main():
+    """Test input validation with various inputs."""
+    print("Input Validation Module Test")
+    print("=" * 80)
+    print()
+
+    # Test cases: (value, expected_valid, field_name)
+    test_cases = [
+        # Query validation
+        ("example concerns", True, "query"),
+        ("a" * 500, True, "query (max length)"),
+        ("a" * 501, False, "query (too long)"),
+        ("", True, "query (empty)"),
+        ("test\x00null", False, "query (null byte)"),
+        # Subreddit validation
+        ("technology", True, "subreddit"),
+        ("Example", True, "subreddit (mixed case)"),
+        ("ab", True, "subreddit (2 chars - min)"),
+        ("a" * 21, True, "subreddit (21 chars - max)"),
+        ("a", False, "subreddit (too short)"),
+        ("a" * 22, False, "subreddit (too long)"),
+        ("test-sub", False, "subreddit (invalid hyphen)"),
+        ("test sub", False, "subreddit (invalid space)"),
+        # Author validation
+        ("danielmicay", True, "author"),
+        ("User_Name-123", True, "author (valid chars)"),
+        ("abc", True, "author (3 chars - min)"),
+        ("a" * 20, True, "author (20 chars - max)"),
+        ("ab", False, "author (too short)"),
+        ("a" * 21, False, "author (too long)"),
+        ("user@domain", False, "author (invalid @ symbol)"),
+        # Score validation
+        (0, True, "score (zero)"),
+        (100, True, "score (positive)"),
+        (-100, True, "score (negative)"),
+        (2147483647, True, "score (max)"),
+        (-2147483648, True, "score (min)"),
+        (2147483648, False, "score (too high)"),
+        # Limit validation
+        (25, True, "limit (default)"),
+        (10, True, "limit (min)"),
+        (100, True, "limit (max)"),
+        (9, False, "limit (too low)"),
+        (101, False, "limit (too high)"),
+        # Offset validation
+        (0, True, "offset (zero)"),
+        (5000, True, "offset (mid-range)"),
+        (10000, True, "offset (max)"),
+        (-1, False, "offset (negative)"),
+        (10001, False, "offset (too high)"),
+    ]
+
+    print("Individual Field Validation Tests:")
+    print("-" * 80)
+
+    for value, expected_valid, description in test_cases:
+        # Determine which validator to use based on description
+        if "query" in description:
+            valid, sanitized, error = (
+                validator.validate_query(value) if isinstance(value, str) else (False, None, "Wrong type")
+            )
+        elif "subreddit" in description:
+            valid, sanitized, error = (
+                validator.validate_subreddit(value) if isinstance(value, str) else (False, None, "Wrong type")
+            )
+        elif "author" in description:
+            valid, sanitized, error = (
+                validator.validate_author(value) if isinstance(value, str) else (False, None, "Wrong type")
+            )
+        elif "score" in description:
+            valid, sanitized, error = validator.validate_score(value)
+        elif "limit" in description:
+            valid, sanitized, error = validator.validate_limit(value)
+        elif "offset" in description:
+            valid, sanitized, error = validator.validate_offset(value)
+        else:
+            valid, sanitized, error = False, None, "Unknown test type"
+
+        # Check if result matches expectation
+        status = "✅ PASS" if valid == expected_valid else "❌ FAIL"
+
+        print(f"{status} | {description}")
+        if not valid and error:
+            print(f"       Error: {error}")
+        if valid and sanitized is not None and sanitized != value:
+            print(f"       Sanitized: {repr(sanitized)}")
+
+    print()
+    print("=" * 80)
+    print()
+
+    # Test comprehensive validation
+    print("Comprehensive Validation Tests:")
+    print("-" * 80)
+
+    comprehensive_tests = [
+        {
+            "name": "Valid search query",
+            "params": {"query": "example", "subreddit": "technology", "limit": 50},
+            "expected_valid": True,
+        },
+        {"name": "Invalid long query", "params": {"query": "a" * 501, "subreddit": "tech"}, "expected_valid": False},
+        {
+            "name": "Invalid subreddit format",
+            "params": {"query": "test", "subreddit": "test-sub"},
+            "expected_valid": False,
+        },
+        {"name": "Invalid author length", "params": {"query": "test", "author": "ab"}, "expected_valid": False},
+        {"name": "Invalid limit range", "params": {"query": "test", "limit": 150}, "expected_valid": False},
+        {
+            "name": "Multiple validation errors",
+            "params": {"query": "", "subreddit": "a", "author": "ab", "limit": 200},
+            "expected_valid": False,
+        },
+    ]
+
+    for test in comprehensive_tests:
+        result = validator.validate_all(**test["params"])
+        status = "✅ PASS" if result.is_valid == test["expected_valid"] else "❌ FAIL"
+
+        print(f"{status} | {test['name']}")
+        if not result.is_valid:
+            for error in result.errors:
+                print(f"       {error}")
+        if result.is_valid and result.sanitized_values:
+            print(f"       Sanitized: {result.sanitized_values}")
+
+    print()
+    print("=" * 80)
+    print("All validation tests completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,8 @@ CREATE INDEX IF NOT EXISTS idx_posts_subreddit_comments ON posts(subreddit, num_
 CREATE INDEX IF NOT EXISTS idx_posts_subreddit_created ON posts(subreddit, created_utc DESC, score DESC, id);
 CREATE INDEX IF NOT EXISTS idx_posts_author ON posts(author, created_utc DESC);
 CREATE INDEX IF NOT EXISTS idx_posts_author_subreddit ON posts(author, subreddit, created_utc DESC);
+-- Index-only scan for per-subreddit user lists (get_user_list_page with subreddit_filter)
+CREATE INDEX IF NOT EXISTS idx_posts_subreddit_author ON posts(subreddit, author);
 CREATE INDEX IF NOT EXISTS idx_posts_permalink ON posts(permalink);
 
 -- BRIN index for time-series optimization (created_utc is monotonically increasing)
@@ -29,6 +31,7 @@ CREATE INDEX IF NOT EXISTS idx_comments_subreddit ON comments(subreddit);
 CREATE INDEX IF NOT EXISTS idx_comments_parent_id ON comments(parent_id);
 CREATE INDEX IF NOT EXISTS idx_comments_author ON comments(author, created_utc DESC);
 CREATE INDEX IF NOT EXISTS idx_comments_author_subreddit ON comments(author, subreddit, created_utc DESC);
+CREATE INDEX IF NOT EXISTS idx_comments_subreddit_author ON comments(subreddit, author);
 CREATE INDEX IF NOT EXISTS idx_comments_subreddit_created ON comments(subreddit, created_utc DESC);
 CREATE INDEX IF NOT EXISTS idx_comments_permalink ON comments(permalink);
 
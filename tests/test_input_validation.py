@@ -16,6 +16,7 @@ from utils.input_validation import (
     MAX_SUBREDDIT_LENGTH,
     MIN_LIMIT,
     MIN_SCORE_VALUE,
+    UNSET_FIELD_DEFAULTS,
     SearchInputValidator,
     ValidationError,
     ValidationResult,
@@ -102,6 +103,16 @@ class TestValidateQuery:
         assert valid is False
         assert "control" in error.lower()
 
+    def test_every_disallowed_control_character_rejected(self, input_validator):
+        """Test each C0 control character except tab, newline, and CR is rejected."""
+        for code in range(1, 32):
+            valid, sanitized, error = input_validator.validate_query(f"test{chr(code)}query")
+            if code in (9, 10, 13):
+                assert valid is True
+            else:
+                assert valid is False
+                assert "control" in error.lower()
+
     def test_tab_and_newline_allowed(self, input_validator):
         """Test that tab and newline are allowed in queries."""
         valid, sanitized, error = input_validator.validate_query("line1\nline2\ttab")
@@ -207,6 +218,19 @@ class TestValidateSubreddit:
         assert valid is False
         assert "invalid" in error.lower()
 
+    def test_subreddit_with_non_ascii_letters_rejected(self, input_validator):
+        """Test subreddit with non-ASCII letters or digits is rejected."""
+        for name in ("café", "test²", "sub٣"):
+            valid, sanitized, error = input_validator.validate_subreddit(name)
+            assert valid is False
+            assert "invalid" in error.lower()
+
+    def test_valid_subreddit_only_underscores(self, input_validator):
+        """Test subreddit made only of underscores matches the format rule."""
+        valid, sanitized, error = input_validator.validate_subreddit("__")
+        assert valid is True
+        assert sanitized == "__"
+
 
 # =============================================================================
 # AUTHOR VALIDATION TESTS
@@ -292,6 +316,12 @@ class TestValidateAuthor:
         assert valid is False
         assert "invalid" in error.lower()
 
+    def test_author_with_non_ascii_letters_rejected(self, input_validator):
+        """Test username with non-ASCII letters is rejected."""
+        valid, sanitized, error = input_validator.validate_author("usér-name")
+        assert valid is False
+        assert "invalid" in error.lower()
+
 
 # =============================================================================
 # SCORE VALIDATION TESTS
@@ -356,6 +386,12 @@ class TestValidateScore:
         assert valid is False
         assert "integer" in error.lower()
 
+    def test_score_bool_rejected(self, input_validator):
+        """Test bool score is rejected rather than treated as 0/1."""
+        valid, sanitized, error = input_validator.validate_score(True)
+        assert valid is False
+        assert "integer" in error.lower()
+
 
 # =============================================================================
 # LIMIT VALIDATION TESTS
@@ -408,6 +444,12 @@ class TestValidateLimit:
         assert valid is True
         assert sanitized == 50
 
+    def test_limit_bool_rejected(self, input_validator):
+        """Test bool limit is rejected rather than treated as 1."""
+        valid, sanitized, error = input_validator.validate_limit(True)
+        assert valid is False
+        assert "integer" in error.lower()
+
 
 # =============================================================================
 # OFFSET VALIDATION TESTS
@@ -687,6 +729,24 @@ class TestValidateAll:
         assert result.sanitized_values["offset"] == 25  # (page 2 - 1) * 25
         assert result.sanitized_values["page"] == 2
 
+    def test_unset_field_defaults_match_validators(self, input_validator):
+        """Test the None shortcut in validate_all yields what each validator returns for None."""
+        validators = {
+            "subreddit": input_validator.validate_subreddit,
+            "author": input_validator.validate_author,
+            "min_score": input_validator.validate_score,
+            "limit": input_validator.validate_limit,
+            "offset": input_validator.validate_offset,
+            "result_type": input_validator.validate_result_type,
+            "sort_by": input_validator.validate_sort_by,
+        }
+        assert set(validators) == set(UNSET_FIELD_DEFAULTS)
+        for field, validate in validators.items():
+            assert validate(None) == (True, UNSET_FIELD_DEFAULTS[field], None)
+
+        result = input_validator.validate_all()
+        assert result.sanitized_values == UNSET_FIELD_DEFAULTS
+
 
 # =============================================================================
 # VALIDATION RESULT CLASS TESTS
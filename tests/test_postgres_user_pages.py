@@ -325,6 +325,101 @@ class TestUserPageGeneration:
                 assert "link_id" in item
 
 
+class TestUserListPagination:
+    """Test keyset pagination and aggregate helpers used by the user batch generators"""
+
+    @staticmethod
+    def _all_pages(db, batch_size, min_activity=0, subreddit_filter=None):
+        """Collect every page, continuing after the last username of each one"""
+        pages = []
+        last_username = None
+        while page := db.get_user_list_page(last_username, batch_size, min_activity, subreddit_filter=subreddit_filter):
+            pages.append(page)
+            last_username = page[-1]
+        return pages
+
+    @staticmethod
+    def _test_users(pages):
+        return [u for page in pages for u in page if u.startswith("test_user_")]
+
+    def test_pages_cover_all_users_in_order(self, clean_database):
+        """Pages continue after the last username without gaps or repeats"""
+        pages = self._all_pages(clean_database, batch_size=3, subreddit_filter="test_usergen")
+
+        assert [u for page in pages for u in page] == sorted(f"test_user_{i}" for i in range(10))
+        assert [len(page) for page in pages] == [3, 3, 3, 1]
+
+    def test_page_after_last_user_is_empty(self, clean_database):
+        """The page after the last user is empty, ending the loop"""
+        db = clean_database
+
+        page = db.get_user_list_page(None, 5, subreddit_filter="test_usergen")
+        page += db.get_user_list_page(page[-1], 5, subreddit_filter="test_usergen")
+
+        assert page == sorted(f"test_user_{i}" for i in range(10))
+        assert db.get_user_list_page(page[-1], 5, subreddit_filter="test_usergen") == []
+
+    def test_page_subreddit_filter(self, clean_database):
+        """Subreddit filter returns only users with content there, case-insensitively"""
+        db = clean_database
+
+        assert db.get_user_list_page(None, 100, subreddit_filter="TEST_USERGEN") == sorted(
+            f"test_user_{i}" for i in range(10)
+        )
+        assert db.get_user_list_page(None, 100, subreddit_filter="test_no_such_subreddit") == []
+
+    def test_page_min_activity(self, clean_database):
+        """min_activity filters on total posts + comments (15 per test user)"""
+        db = clean_database
+
+        assert len(self._test_users(self._all_pages(db, batch_size=500, min_activity=15))) == 10
+        assert self._test_users(self._all_pages(db, batch_size=500, min_activity=16)) == []
+        assert db.get_user_list_page(None, 100, min_activity=16, subreddit_filter="test_usergen") == []
+
+    def test_page_user_on_multiple_platforms(self, clean_database):
+        """A username with rows on several platforms is returned once"""
+        db = clean_database
+
+        with db.pool.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO users (username, platform, post_count, comment_count)
+                    VALUES ('test_user_0', 'voat', 20, 0)
+                """
+                )
+                conn.commit()
+
+        usernames = self._test_users(self._all_pages(db, batch_size=500))
+        assert usernames.count("test_user_0") == 1
+        assert len(usernames) == 10
+
+        subreddit_users = [
+            u for page in self._all_pages(db, batch_size=1, subreddit_filter="test_usergen") for u in page
+        ]
+        assert subreddit_users == sorted(f"test_user_{i}" for i in range(10))
+
+        # Only the voat row meets this threshold
+        assert db.get_user_list_page(None, 100, min_activity=16, subreddit_filter="test_usergen") == ["test_user_0"]
+
+    def test_user_count_matches_user_list(self, clean_database):
+        """get_user_count counts distinct usernames without loading them"""
+        db = clean_database
+
+        assert db.get_user_count(15) == len(set(db.get_user_list(min_activity=15)))
+        assert db.get_user_count(15) >= 10
+
+    def test_iter_user_activity_batch(self, clean_database):
+        """Users without content are skipped and the rest keep request order"""
+        db = clean_database
+
+        batch = list(db.iter_user_activity_batch(["test_user_3", "test_user_missing", "test_user_1"]))
+        assert [username for username, _ in batch] == ["test_user_3", "test_user_1"]
+        assert all(user_data["all_content"] for _, user_data in batch)
+
+        assert list(db.iter_user_activity_batch(["test_user_3"], min_score=10**9)) == []
+
+
 if __name__ == "__main__":
     """Run tests directly"""
     pytest.main([__file__, "-v", "-s"])
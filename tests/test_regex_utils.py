@@ -6,10 +6,12 @@ ABOUTME: Tests timeout protection, normal regex operations, and edge cases
 
 import platform
 import re
+import threading
 
 import pytest
 
 from utils.regex_utils import RegexTimeout, SafeRegex, safe_regex
+from utils.regex_utils import compile as compile_pattern
 from utils.regex_utils import findall as safe_findall
 from utils.regex_utils import search as safe_search
 from utils.regex_utils import sub as safe_sub
@@ -83,6 +85,29 @@ class TestNormalPatterns:
 
         assert result == "query words"
 
+    def test_backreference_pattern(self, fresh_regex):
+        """Test patterns RE2 cannot compile still work."""
+        result = fresh_regex.search(r"(a)\1", "xaay")
+
+        assert result is not None
+        assert result.group(0) == "aa"
+
+    def test_dollar_before_trailing_newline(self, fresh_regex):
+        """Test $ keeps re semantics (matches before a trailing newline)."""
+        result = fresh_regex.search(r"c$", "abc\n")
+
+        assert result is not None
+
+    def test_search_from_worker_thread(self, fresh_regex):
+        """Test operations work off the main thread (no SIGALRM there)."""
+        results = []
+        worker = threading.Thread(target=lambda: results.append(fresh_regex.search(r"\d+", "abc 123")))
+        worker.start()
+        worker.join()
+
+        assert results[0] is not None
+        assert results[0].group(0) == "123"
+
     def test_sub_no_match(self, fresh_regex):
         """Test substitution with no match returns original."""
         result = fresh_regex.sub(r"notfound", "REPLACED", "original text")
@@ -120,6 +145,21 @@ class TestNormalPatterns:
 
         assert result is None
 
+    def test_search_compiled_pattern(self, fresh_regex):
+        """Test search with a precompiled pattern keeps its flags."""
+        pattern = compile_pattern(r"\bsub:(\w+)", re.IGNORECASE)
+        result = fresh_regex.search_compiled(pattern, "query SUB:Tech")
+
+        assert result is not None
+        assert result.group(1) == "Tech"
+
+    def test_sub_compiled_pattern(self, fresh_regex):
+        """Test substitution with a precompiled pattern."""
+        pattern = compile_pattern(r"\s+sub:\w+", re.IGNORECASE)
+        result = fresh_regex.sub_compiled(pattern, "", "query SUB:tech words")
+
+        assert result == "query words"
+
 
 # =============================================================================
 # CONVENIENCE FUNCTION TESTS
@@ -170,6 +210,18 @@ class TestTimeoutCounter:
 
         assert fresh_regex.get_timeout_count() == 0
 
+    def test_timeout_warnings_rate_limited(self, fresh_regex, monkeypatch):
+        """Test repeated timeouts are all counted but warned about once per second."""
+        warnings = []
+        monkeypatch.setattr("utils.regex_utils.print_warning", warnings.append)
+
+        for _ in range(100):
+            fresh_regex._record_timeout("pattern", r"\w+")
+
+        assert fresh_regex.get_timeout_count() == 100
+        assert len(warnings) == 1
+        assert "Regex timeout #1 on pattern" in warnings[0]
+
 
 # =============================================================================
 # REGEX TIMEOUT EXCEPTION TESTS
@@ -185,6 +237,10 @@ class TestRegexTimeoutException:
         with pytest.raises(RegexTimeout):
             raise RegexTimeout("test timeout")
 
+    def test_exception_is_timeout_error(self):
+        """Test RegexTimeout is caught together with the regex module's TimeoutError."""
+        assert issubclass(RegexTimeout, TimeoutError)
+
     def test_exception_message(self):
         """Test exception message is preserved."""
         try:
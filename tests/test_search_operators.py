@@ -4,6 +4,8 @@ ABOUTME: Unit tests for Google-style search operator parsing
 ABOUTME: Tests query parsing, XSS prevention, and ReDoS protection
 """
 
+import dataclasses
+
 import pytest
 
 from utils.search_operators import (
@@ -486,6 +488,20 @@ class TestParsedSearchQuery:
         assert parsed.result_type is None
         assert parsed.sort_by is None
 
+    def test_immutable(self):
+        """Test parsed queries cannot be modified (results are shared from a cache)."""
+        parsed = ParsedSearchQuery(query_text="test")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            parsed.subreddit = "tech"
+
+    def test_repeated_query_reuses_result(self):
+        """Test parsing the same query twice returns the cached result."""
+        first = parse_search_operators("python sub:technology score:10+")
+        second = parse_search_operators("python sub:technology score:10+")
+
+        assert first is second
+
 
 # =============================================================================
 # SEARCH TIPS TESTS
@@ -565,3 +581,24 @@ class TestEdgeCases:
 
         # Should preserve non-operator colons
         assert "10:30" in result.query_text or "time" in result.query_text
+
+    def test_sort_newest_removed_completely(self):
+        """Test long sort names are stripped without leaving a suffix behind."""
+        result = parse_search_operators("python sort:newest")
+
+        assert result.sort_by == "created_utc"
+        assert result.query_text == "python"
+
+    def test_operator_inside_punctuation(self):
+        """Test operators embedded in punctuation are still extracted."""
+        result = parse_search_operators("(sub:technology) python")
+
+        assert result.subreddit == "technology"
+        assert "python" in result.query_text
+
+    def test_partial_type_value(self):
+        """Test irregular operator values behave as before (type:posts)."""
+        result = parse_search_operators("query type:posts")
+
+        assert result.result_type == "post"
+        assert result.query_text.startswith("query")
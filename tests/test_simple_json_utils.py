@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+"""
+ABOUTME: Unit tests for simple_json_utils JSON serialization and PostgreSQL user batch generators
+ABOUTME: Uses tmp_path for JSON files and a fake database for prefetching, early close, and errors
+"""
+
+import json
+import logging
+import math
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+from utils import simple_json_utils
+from utils.simple_json_utils import (
+    _dumps,
+    _prefetch,
+    get_user_batches_for_subreddit_sqlite,
+    get_user_batches_sqlite,
+    read_json_safe,
+    write_json_safe,
+)
+
+# output_dir is accepted for API compatibility; the generators never touch it
+OUTPUT_DIR = "output"
+
+# =============================================================================
+# TEST FIXTURES
+# =============================================================================
+
+
+class FakeDatabase:
+    """Stands in for PostgresDatabase with a fixed, sorted user list."""
+
+    def __init__(self, user_count=10, fail_on_page=None):
+        self.usernames = [f"user_{i:03d}" for i in range(user_count)]
+        self.fail_on_page = fail_on_page
+        self.page_requests = []
+
+    def get_user_count(self, min_activity=0):
+        return len(self.usernames)
+
+    def get_user_list_page(self, last_username, batch_size, min_activity=0, subreddit_filter=None):
+        self.page_requests.append((last_username, batch_size, subreddit_filter))
+        if self.fail_on_page is not None and len(self.page_requests) == self.fail_on_page:
+            raise RuntimeError("page query failed")
+        remaining = [u for u in self.usernames if last_username is None or u > last_username]
+        return remaining[:batch_size]
+
+    def iter_user_activity_batch(self, usernames, subreddit_filter=None, **filters):
+        for username in usernames:
+            yield username, {"posts": [], "comments": [], "all_content": [{"subreddit": subreddit_filter}]}
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    """Install a FakeDatabase as the shared database used by the generators."""
+    db = FakeDatabase()
+    monkeypatch.setattr(simple_json_utils, "_get_database", lambda: db)
+    return db
+
+
+def prefetch_threads():
+    return [t for t in threading.enumerate() if t.name == "user-batch-prefetch"]
+
+
+# =============================================================================
+# JSON SERIALIZATION TESTS
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestJsonSerialization:
+    """Test that JSON helper files stay compatible with json.dump output."""
+
+    def test_output_parses_to_same_data(self):
+        data = {"name": "ünïcode", "small": 1e-7, "large": 1e16, "ints": [1, 2, 3], "none": None}
+
+        assert json.loads(_dumps(data)) == data
+        assert "ünïcode".encode() in _dumps(data)
+
+    def test_non_finite_floats_are_not_written_as_null(self):
+        data = {"stats": {"avg_score": float("nan"), "max_ratio": float("inf"), "min_ratio": float("-inf")}}
+
+        stats = json.loads(_dumps(data))["stats"]
+
+        assert math.isnan(stats["avg_score"])
+        assert stats["max_ratio"] == float("inf")
+        assert stats["min_ratio"] == float("-inf")
+
+    def test_non_finite_floats_round_trip_through_file(self, tmp_path):
+        path = str(tmp_path / "stats.json")
+
+        assert write_json_safe(path, {"example": {"avg_score": float("nan"), "count": None}})
+        loaded = read_json_safe(path, {})
+
+        assert math.isnan(loaded["example"]["avg_score"])
+        assert loaded["example"]["count"] is None
+
+    def test_corrupt_file_returns_default(self, tmp_path):
+        path = tmp_path / "corrupt.json"
+        path.write_text('{"truncated": ')
+
+        assert read_json_safe(str(path), {"default": True}) == {"default": True}
+
+
+@pytest.mark.unit
+class TestAtomicWrite:
+    """Test the temporary-file-and-rename writer behind the JSON helpers."""
+
+    def test_concurrent_writers_never_leave_partial_file(self, tmp_path):
+        path = str(tmp_path / "shared.json")
+        payloads = [{"writer": i, "rows": list(range(20_000))} for i in range(8)]
+        threads = [threading.Thread(target=write_json_safe, args=(path, data)) for data in payloads]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert read_json_safe(path) in payloads
+        assert os.listdir(tmp_path) == ["shared.json"]
+
+    def test_existing_file_mode_is_kept(self, tmp_path):
+        path = tmp_path / "stats.json"
+        path.write_text("{}")
+        path.chmod(0o640)
+
+        assert write_json_safe(str(path), {"updated": True})
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    def test_new_file_is_not_private(self, tmp_path):
+        path = tmp_path / "new.json"
+
+        assert write_json_safe(str(path), {"created": True})
+
+        # mkstemp's 0600 must not leak through to the final file
+        assert stat.S_IMODE(path.stat().st_mode) == simple_json_utils._NEW_FILE_MODE
+
+    def test_failed_write_removes_temporary_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "stats.json"
+        path.write_text('{"kept": true}')
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(simple_json_utils.os, "replace", failing_replace)
+
+        assert not write_json_safe(str(path), {"kept": False})
+        assert read_json_safe(str(path)) == {"kept": True}
+        assert os.listdir(tmp_path) == ["stats.json"]
+
+
+# =============================================================================
+# PREFETCH TESTS
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestPrefetch:
+    """Test the background batch handoff."""
+
+    def test_yields_all_items_in_order(self):
+        assert list(_prefetch(iter(range(5)))) == [0, 1, 2, 3, 4]
+        assert prefetch_threads() == []
+
+    def test_producer_exception_reaches_consumer(self):
+        def failing():
+            yield 1
+            raise ValueError("fetch failed")
+
+        consumed = []
+        with pytest.raises(ValueError, match="fetch failed"):
+            for item in _prefetch(failing()):
+                consumed.append(item)
+
+        assert consumed == [1]
+        assert prefetch_threads() == []
+
+    def test_early_close_stops_producer(self):
+        def endless():
+            i = 0
+            while True:
+                yield i
+                i += 1
+
+        batches = _prefetch(endless())
+        assert next(batches) == 0
+        batches.close()
+
+        assert prefetch_threads() == []
+
+
+@pytest.mark.unit
+class TestSharedDatabase:
+    """Test lazy creation of the shared PostgresDatabase."""
+
+    def test_concurrent_first_calls_create_one_database(self, monkeypatch):
+        created = []
+        barrier = threading.Barrier(4)
+
+        class SlowDatabase:
+            def __init__(self, *args, **kwargs):
+                # Widen the window in which an unlocked check would let a second caller in
+                time.sleep(0.05)
+                created.append(self)
+                self.pool = type("Pool", (), {"close_all": lambda self: None})()
+
+        monkeypatch.setattr(simple_json_utils, "_db", None)
+        monkeypatch.setattr(simple_json_utils, "PostgresDatabase", SlowDatabase)
+        monkeypatch.setattr(simple_json_utils, "get_archive_database_connection_string", lambda: "postgresql://test")
+        results = []
+
+        def first_call():
+            barrier.wait()
+            results.append(simple_json_utils._get_database())
+
+        threads = [threading.Thread(target=first_call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(created) == 1
+        assert all(db is created[0] for db in results)
+
+
+# =============================================================================
+# GENERATOR TESTS
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestUserBatchGenerators:
+    """Test the user batch generators against a fake database."""
+
+    def test_batches_follow_keyset_pages(self, fake_db):
+        batches = list(get_user_batches_sqlite(OUTPUT_DIR, batch_size=4))
+
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert [username for batch in batches for username, _ in batch] == fake_db.usernames
+        assert [last for last, _, _ in fake_db.page_requests] == [None, "user_003", "user_007", "user_009"]
+
+    def test_early_close_leaves_no_prefetch_thread(self, fake_db):
+        batches = get_user_batches_sqlite(OUTPUT_DIR, batch_size=2)
+        next(batches)
+        batches.close()
+
+        assert prefetch_threads() == []
+
+    def test_producer_exception_reaches_consumer(self, fake_db, caplog):
+        fake_db.fail_on_page = 2
+
+        with caplog.at_level(logging.ERROR, logger=simple_json_utils.__name__):
+            batches = list(get_user_batches_sqlite(OUTPUT_DIR, batch_size=4))
+
+        # The first batch is delivered, then the generator reports the failure
+        assert [len(batch) for batch in batches] == [4]
+        assert "page query failed" in caplog.text
+        assert prefetch_threads() == []
+
+    def test_subreddit_batches_pass_folded_filter(self, fake_db):
+        batches = list(get_user_batches_for_subreddit_sqlite(OUTPUT_DIR, "AskReddit", batch_size=5))
+
+        assert [len(batch) for batch in batches] == [5, 5]
+        assert {subreddit for _, _, subreddit in fake_db.page_requests} == {"askreddit"}
+        assert batches[0][0][1]["all_content"][0]["subreddit"] == "askreddit"
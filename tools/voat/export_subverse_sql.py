@@ -4,42 +4,79 @@ ABOUTME: Export individual Voat subverses as standalone SQL dumps
 ABOUTME: Creates per-subverse .sql files for distributed archiving
 """
 
+import csv
+import io
 import os
+import shlex
 import subprocess
 import sys
 from pathlib import Path
 
-# Database connection
-DB_HOST = "localhost"
-DB_PORT = "5435"
-DB_NAME = "reddarchiver"
-DB_USER = "reddarchiver"
-DB_PASS = "CHANGE_THIS_PASSWORD"
+from voat_psql import PSQL_BASE, PSQL_ENV
 
 OUTPUT_DIR = "/tmp/voat-subverse-exports"
 Path(OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
 
 
-def export_subverse_sql(subverse: str, output_path: str):
-    """Export a single subverse to SQL file."""
+COPY_OPTIONS = "WITH (FORMAT text, DELIMITER E'\\t', NULL '\\N')"
 
-    # Build WHERE clause
-    where_clause = f"WHERE platform = 'voat' AND subreddit = '{subverse}'"
 
-    # Export posts
-    posts_sql = f"""
-    COPY (
-        SELECT * FROM posts {where_clause}
-    ) TO STDOUT WITH (FORMAT text, DELIMITER E'\\t', NULL '\\N');
+def run_psql_script(script: str, stdout, variables: dict[str, str]) -> subprocess.CompletedProcess:
+    """Run a multi-statement psql script in one session, streaming output to stdout.
+
+    Values in variables are set with -v and should be referenced as :'name'
+    in the script, which makes psql quote them as SQL literals.
+    """
+    var_args = [arg for name, value in variables.items() for arg in ("-v", f"{name}={value}")]
+    return subprocess.run(
+        [*PSQL_BASE, "-q", "-v", "ON_ERROR_STOP=1", *var_args, "-f", "-"],
+        input=script,
+        stdout=stdout,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=PSQL_ENV,
+    )
+
+
+def server_copy_target(server_path: str) -> str:
+    """Build a COPY target that appends rows to a file on the database server."""
+    program = f"cat >> {shlex.quote(server_path)}"
+    return "PROGRAM '" + program.replace("'", "''") + "'"
+
+
+def export_subverse_sql(subverse: str, output_path: str, server_dir: str | None = None):
+    """Export a single subverse to SQL file.
+
+    When server_dir is given, OUTPUT_DIR is expected to be visible to the
+    postgres server at that path (bind mount), and rows are written by the
+    server itself via COPY ... TO PROGRAM instead of streaming through psql.
     """
 
+    # Build WHERE clause (:'subverse' is quoted by psql, so any name is safe)
+    where_clause = "WHERE platform = 'voat' AND subreddit = :'subverse'"
+
+    # Export posts
+    posts_query = f"SELECT * FROM posts {where_clause}"
+
     # Export comments (join to get only comments for posts in this subverse)
-    comments_sql = f"""
-    COPY (
+    comments_query = """
         SELECT c.* FROM comments c
         INNER JOIN posts p ON c.post_id = p.id
-        WHERE c.platform = 'voat' AND p.subreddit = '{subverse}'
-    ) TO STDOUT WITH (FORMAT text, DELIMITER E'\\t', NULL '\\N');
+        WHERE c.platform = 'voat' AND p.subreddit = :'subverse'
+    """
+
+    if server_dir:
+        target = server_copy_target(os.path.join(server_dir, os.path.basename(output_path)))
+    else:
+        target = "STDOUT"
+
+    # Section headers go through the same COPY target as the rows so they stay
+    # in order in both modes; everything runs in a single psql session.
+    script = f"""
+    COPY (VALUES ('-- Posts for v/' || :'subverse')) TO {target};
+    COPY ({posts_query}) TO {target} {COPY_OPTIONS};
+    COPY (VALUES (''), ('-- Comments for v/' || :'subverse')) TO {target};
+    COPY ({comments_query}) TO {target} {COPY_OPTIONS};
     """
 
     print(f"Exporting v/{subverse}...")
@@ -48,46 +85,13 @@ def export_subverse_sql(subverse: str, output_path: str):
         # Write header
         f.write(f"-- Voat subverse: {subverse}\n")
         f.write("-- Generated from redd-archiver PostgreSQL database\n\n")
+        f.flush()
 
-        # Export posts
-        f.write(f"-- Posts for v/{subverse}\n")
-        result = subprocess.run(
-            ["sudo", "docker", "exec", "reddarchiver-postgres", "psql", "-U", DB_USER, "-d", DB_NAME, "-c", posts_sql],
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode == 0:
-            f.write(result.stdout)
-        else:
-            print(f"  ERROR: {result.stderr}")
-            return False
+        result = run_psql_script(script, stdout=f, variables={"subverse": subverse})
 
-        # Export comments
-        f.write(f"\n-- Comments for v/{subverse}\n")
-        result = subprocess.run(
-            [
-                "sudo",
-                "docker",
-                "exec",
-                "reddarchiver-postgres",
-                "psql",
-                "-U",
-                DB_USER,
-                "-d",
-                DB_NAME,
-                "-c",
-                comments_sql,
-            ],
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode == 0:
-            f.write(result.stdout)
-        else:
-            print(f"  ERROR: {result.stderr}")
-            return False
+    if result.returncode != 0:
+        print(f"  ERROR: {result.stderr}")
+        return False
 
     # Get file size
     size_mb = os.path.getsize(output_path) / (1024 * 1024)
@@ -103,28 +107,26 @@ def main():
     parser.add_argument("--top", type=int, help="Export top N subverses by post count")
     parser.add_argument("--min-posts", type=int, default=50, help="Minimum post count (default: 50)")
     parser.add_argument("--max-posts", type=int, default=10000, help="Maximum post count (default: 10000)")
+    parser.add_argument(
+        "--server-dir",
+        help=f"Path where the postgres server sees {OUTPUT_DIR} (bind mount); rows are then written "
+        "server-side via COPY TO PROGRAM (requires superuser or pg_execute_server_program)",
+    )
 
     args = parser.parse_args()
 
     if args.subverse:
         # Export single subverse
         output_path = os.path.join(OUTPUT_DIR, f"{args.subverse}.sql")
-        export_subverse_sql(args.subverse, output_path)
+        export_subverse_sql(args.subverse, output_path, args.server_dir)
 
     elif args.top:
         # Get top N subverses
         result = subprocess.run(
             [
-                "sudo",
-                "docker",
-                "exec",
-                "reddarchiver-postgres",
-                "psql",
-                "-U",
-                DB_USER,
-                "-d",
-                DB_NAME,
+                *PSQL_BASE,
                 "-t",
+                "--csv",
                 "-c",
                 f"""
             SELECT subreddit, COUNT(*) as posts
@@ -139,14 +141,15 @@ def main():
             ],
             capture_output=True,
             text=True,
+            env=PSQL_ENV,
         )
 
         if result.returncode == 0:
-            for line in result.stdout.strip().split("\n"):
-                if "|" in line:
-                    subverse = line.split("|")[0].strip()
+            for row in csv.reader(io.StringIO(result.stdout)):
+                if row:
+                    subverse = row[0]
                     output_path = os.path.join(OUTPUT_DIR, f"{subverse}.sql")
-                    export_subverse_sql(subverse, output_path)
+                    export_subverse_sql(subverse, output_path, args.server_dir)
         else:
             print(f"ERROR: {result.stderr}")
 
@@ -4,11 +4,15 @@ ABOUTME: Export curated Voat subverse collections to SQL or HTML
 ABOUTME: Predefined collections: tech, gaming, news, culture, etc.
 """
 
+import csv
+import io
 import os
 import subprocess
 import sys
 from pathlib import Path
 
+from voat_psql import PSQL_BASE, PSQL_ENV, sql_literal
+
 # Curated Voat Collections
 COLLECTIONS = {
     "tech": {
@@ -73,11 +77,6 @@ COLLECTIONS = {
 OUTPUT_DIR = "/tmp/voat-collections"
 Path(OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
 
-DB_HOST = "localhost"
-DB_PORT = "5435"
-DB_NAME = "reddarchiver"
-DB_USER = "reddarchiver"
-
 
 def export_collection_sql(collection_name: str, subverses: list, output_path: str):
     """Export a collection of subverses to single SQL file."""
@@ -85,14 +84,14 @@ def export_collection_sql(collection_name: str, subverses: list, output_path: st
     print(f"\nExporting collection: {collection_name}")
     print(f"Subverses: {', '.join(subverses)}")
 
-    subverse_list = "', '".join(subverses)
+    subverse_list = ", ".join(sql_literal(subverse) for subverse in subverses)
 
     # Export posts
     posts_sql = f"""
     COPY (
         SELECT * FROM posts
         WHERE platform = 'voat'
-          AND subreddit IN ('{subverse_list}')
+          AND subreddit IN ({subverse_list})
         ORDER BY subreddit, created_utc DESC
     ) TO STDOUT WITH (FORMAT text, DELIMITER E'\\t', NULL '\\N');
     """
@@ -103,7 +102,7 @@ def export_collection_sql(collection_name: str, subverses: list, output_path: st
         SELECT c.* FROM comments c
         INNER JOIN posts p ON c.post_id = p.id
         WHERE c.platform = 'voat'
-          AND p.subreddit IN ('{subverse_list}')
+          AND p.subreddit IN ({subverse_list})
         ORDER BY p.subreddit, c.created_utc DESC
     ) TO STDOUT WITH (FORMAT text, DELIMITER E'\\t', NULL '\\N');
     """
@@ -117,14 +116,15 @@ def export_collection_sql(collection_name: str, subverses: list, output_path: st
         # Export posts
         f.write(f"-- Posts for collection '{collection_name}'\n")
         result = subprocess.run(
-            ["sudo", "docker", "exec", "reddarchiver-postgres", "psql", "-U", DB_USER, "-d", DB_NAME, "-c", posts_sql],
+            [*PSQL_BASE, "-c", posts_sql],
             capture_output=True,
             text=True,
+            env=PSQL_ENV,
         )
 
         if result.returncode == 0:
             f.write(result.stdout)
-            post_count = len(result.stdout.strip().split("\n"))
+            post_count = result.stdout.count("\n")
             print(f"  ✓ Exported {post_count:,} posts")
         else:
             print(f"  ERROR: {result.stderr}")
@@ -133,26 +133,15 @@ def export_collection_sql(collection_name: str, subverses: list, output_path: st
         # Export comments
         f.write(f"\n-- Comments for collection '{collection_name}'\n")
         result = subprocess.run(
-            [
-                "sudo",
-                "docker",
-                "exec",
-                "reddarchiver-postgres",
-                "psql",
-                "-U",
-                DB_USER,
-                "-d",
-                DB_NAME,
-                "-c",
-                comments_sql,
-            ],
+            [*PSQL_BASE, "-c", comments_sql],
             capture_output=True,
             text=True,
+            env=PSQL_ENV,
         )
 
         if result.returncode == 0:
             f.write(result.stdout)
-            comment_count = len(result.stdout.strip().split("\n"))
+            comment_count = result.stdout.count("\n")
             print(f"  ✓ Exported {comment_count:,} comments")
         else:
             print(f"  ERROR: {result.stderr}")
@@ -180,50 +169,55 @@ def generate_stats():
     print("VOAT COLLECTION STATISTICS")
     print("=" * 70 + "\n")
 
-    for _key, info in COLLECTIONS.items():
-        subverse_list = "', '".join(info["subverses"])
+    # One aggregation for all collections: subverse -> collection key via a VALUES table
+    mapping = ", ".join(
+        f"({sql_literal(subverse)}, {sql_literal(key)})"
+        for key, info in COLLECTIONS.items()
+        for subverse in info["subverses"]
+    )
+
+    result = subprocess.run(
+        [
+            *PSQL_BASE,
+            "-t",
+            "--csv",
+            "-c",
+            f"""
+        WITH m(subreddit, collection) AS (VALUES {mapping})
+        SELECT
+            m.collection,
+            COUNT(DISTINCT p.id) as posts,
+            COUNT(DISTINCT c.id) as comments,
+            COUNT(DISTINCT p.author) as authors
+        FROM m
+        JOIN posts p ON p.subreddit = m.subreddit AND p.platform = 'voat'
+        LEFT JOIN comments c ON c.post_id = p.id AND c.platform = 'voat'
+        GROUP BY m.collection;
+        """,
+        ],
+        capture_output=True,
+        text=True,
+        env=PSQL_ENV,
+    )
 
-        result = subprocess.run(
-            [
-                "sudo",
-                "docker",
-                "exec",
-                "reddarchiver-postgres",
-                "psql",
-                "-U",
-                DB_USER,
-                "-d",
-                DB_NAME,
-                "-t",
-                "-c",
-                f"""
-            SELECT
-                COUNT(DISTINCT p.id) as posts,
-                COUNT(DISTINCT c.id) as comments,
-                COUNT(DISTINCT p.author) as authors
-            FROM posts p
-            LEFT JOIN comments c ON c.post_id = p.id AND c.platform = 'voat'
-            WHERE p.platform = 'voat'
-              AND p.subreddit IN ('{subverse_list}');
-            """,
-            ],
-            capture_output=True,
-            text=True,
-        )
+    if result.returncode != 0:
+        print(f"ERROR: {result.stderr}")
+        return
 
-        if result.returncode == 0:
-            stats = result.stdout.strip().split("|")
-            if len(stats) == 3:
-                posts = int(stats[0].strip())
-                comments = int(stats[1].strip())
-                authors = int(stats[2].strip())
-
-                print(f"{info['name']}")
-                print(f"  Subverses: {len(info['subverses'])}")
-                print(f"  Posts: {posts:,}")
-                print(f"  Comments: {comments:,}")
-                print(f"  Authors: {authors:,}")
-                print()
+    stats_by_collection = {}
+    for row in csv.reader(io.StringIO(result.stdout)):
+        if len(row) == 4:
+            stats_by_collection[row[0]] = [int(v) for v in row[1:]]
+
+    for key, info in COLLECTIONS.items():
+        posts, comments, authors = stats_by_collection.get(key, (0, 0, 0))
+
+        print(f"{info['name']}")
+        print(f"  Subverses: {len(info['subverses'])}")
+        print(f"  Posts: {posts:,}")
+        print(f"  Comments: {comments:,}")
+        print(f"  Authors: {authors:,}")
+        print()
 
 
 def main():
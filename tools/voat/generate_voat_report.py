@@ -4,33 +4,78 @@ ABOUTME: Generate comprehensive Voat archive statistics report
 ABOUTME: Creates markdown report with database statistics and top content
 """
 
+import argparse
+import csv
+import io
+import json
+import os
 import subprocess
 from datetime import datetime
 
-DB_USER = "reddarchiver"
-DB_NAME = "reddarchiver"
+from voat_psql import PSQL_BASE, PSQL_ENV, sql_literal
 
+OUTPUT_PATH = "/output/VOAT_ARCHIVE_REPORT.md"
+CACHE_PATH = OUTPUT_PATH + ".cache.json"
 
-def query_db(sql: str) -> str:
-    """Execute SQL query via docker and return result."""
+
+def query_db(sql: str) -> list[list[str]]:
+    """Execute SQL query via psql and return result rows as lists of fields."""
     result = subprocess.run(
-        ["sudo", "docker", "exec", "reddarchiver-postgres", "psql", "-U", DB_USER, "-d", DB_NAME, "-t", "-c", sql],
+        [*PSQL_BASE, "-t", "--csv", "-c", sql],
         capture_output=True,
         text=True,
+        env=PSQL_ENV,
     )
-    return result.stdout.strip()
+    # CSV quoting keeps fields intact even when titles contain separators or newlines
+    return list(csv.reader(io.StringIO(result.stdout)))
+
+
+def data_fingerprint() -> list[str]:
+    """Return row counts and newest timestamps for Voat posts and comments."""
+    rows = query_db("""
+        SELECT
+            (SELECT COUNT(*) FROM posts WHERE platform = 'voat'),
+            (SELECT MAX(created_utc) FROM posts WHERE platform = 'voat'),
+            (SELECT COUNT(*) FROM comments WHERE platform = 'voat'),
+            (SELECT MAX(created_utc) FROM comments WHERE platform = 'voat');
+    """)
+    return rows[0] if rows else []
+
+
+def load_cached_report(fingerprint: list[str]) -> str | None:
+    """Return the cached report if it was generated from the same data."""
+    try:
+        with open(CACHE_PATH) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if fingerprint and cache.get("fingerprint") == fingerprint:
+        return cache.get("report")
+    return None
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate Voat archive statistics report")
+    parser.add_argument("--force", action="store_true", help="Regenerate even if the data has not changed")
+    args = parser.parse_args()
+
+    fingerprint = data_fingerprint()
+    cached = None if args.force else load_cached_report(fingerprint)
+    if cached is not None:
+        with open(OUTPUT_PATH, "w") as f:
+            f.write(cached)
+        print(f"✓ No new Voat data since last run, report re-emitted from cache: {OUTPUT_PATH}")
+        return
+
     print("Generating Voat Archive Report...")
 
-    report = []
-    report.append("# Voat Archive Statistics Report")
-    report.append(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-    report.append("\n---\n")
+    report = io.StringIO()
+    report.write("# Voat Archive Statistics Report\n")
+    report.write(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
+    report.write("\n---\n\n")
 
     # Overall statistics
-    report.append("## Overall Statistics\n")
+    report.write("## Overall Statistics\n\n")
 
     stats = query_db("""
         SELECT
@@ -43,15 +88,14 @@ def main():
         WHERE platform = 'voat';
     """)
 
-    if stats:
-        parts = [p.strip() for p in stats.split("|")]
-        if len(parts) >= 5:
-            report.append(f"- **Total Posts**: {int(parts[0]):,}")
-            report.append(f"- **Total Subverses**: {int(parts[1]):,}")
-            report.append(f"- **Total Authors**: {int(parts[2]):,}")
-            report.append(
-                f"- **Date Range**: {datetime.fromtimestamp(int(parts[3])).strftime('%Y-%m-%d')} to {datetime.fromtimestamp(int(parts[4])).strftime('%Y-%m-%d')}"
-            )
+    if stats and len(stats[0]) >= 5 and stats[0][3]:
+        posts, subverses, authors, earliest, latest = stats[0][:5]
+        report.write(f"- **Total Posts**: {int(posts):,}\n")
+        report.write(f"- **Total Subverses**: {int(subverses):,}\n")
+        report.write(f"- **Total Authors**: {int(authors):,}\n")
+        report.write(
+            f"- **Date Range**: {datetime.fromtimestamp(int(earliest)).strftime('%Y-%m-%d')} to {datetime.fromtimestamp(int(latest)).strftime('%Y-%m-%d')}\n"
+        )
 
     # Comment statistics
     comment_stats = query_db("""
@@ -62,16 +106,15 @@ def main():
         WHERE platform = 'voat';
     """)
 
-    if comment_stats:
-        parts = [p.strip() for p in comment_stats.split("|")]
-        if len(parts) >= 2:
-            report.append(f"- **Total Comments**: {int(parts[0]):,}")
-            report.append(f"- **Comment Authors**: {int(parts[1]):,}")
+    if comment_stats and len(comment_stats[0]) >= 2:
+        comments, comment_authors = comment_stats[0][:2]
+        report.write(f"- **Total Comments**: {int(comments):,}\n")
+        report.write(f"- **Comment Authors**: {int(comment_authors):,}\n")
 
     # Top subverses
-    report.append("\n## Top 20 Subverses by Post Count\n")
-    report.append("| Subverse | Posts | Comments | Top Score |")
-    report.append("|----------|-------|----------|-----------|")
+    report.write("\n## Top 20 Subverses by Post Count\n\n")
+    report.write("| Subverse | Posts | Comments | Top Score |\n")
+    report.write("|----------|-------|----------|-----------|\n")
 
     top_subverses = query_db("""
         SELECT
@@ -87,16 +130,14 @@ def main():
         LIMIT 20;
     """)
 
-    for line in top_subverses.split("\n"):
-        if "|" in line:
-            parts = [p.strip() for p in line.split("|")]
-            if len(parts) >= 4:
-                report.append(f"| {parts[0]} | {int(parts[1]):,} | {int(parts[2]):,} | {int(parts[3]):,} |")
+    for row in top_subverses:
+        if len(row) >= 4:
+            report.write(f"| {row[0]} | {int(row[1]):,} | {int(row[2]):,} | {int(row[3]):,} |\n")
 
     # Top posts
-    report.append("\n## Top 20 Posts by Score\n")
-    report.append("| Score | Subverse | Title | Author |")
-    report.append("|-------|----------|-------|--------|")
+    report.write("\n## Top 20 Posts by Score\n\n")
+    report.write("| Score | Subverse | Title | Author |\n")
+    report.write("|-------|----------|-------|--------|\n")
 
     top_posts = query_db("""
         SELECT
@@ -110,40 +151,48 @@ def main():
         LIMIT 20;
     """)
 
-    for line in top_posts.split("\n"):
-        if "|" in line:
-            parts = [p.strip() for p in line.split("|")]
-            if len(parts) >= 4:
-                report.append(f"| {parts[0]} | {parts[1]} | {parts[2]} | {parts[3]} |")
+    for row in top_posts:
+        if len(row) >= 4:
+            report.write(f"| {row[0]} | {row[1]} | {row[2]} | {row[3]} |\n")
 
     # Most active authors
-    report.append("\n## Top 20 Most Active Authors\n")
-    report.append("| Author | Posts | Comments | Total Karma |")
-    report.append("|--------|-------|----------|-------------|")
+    report.write("\n## Top 20 Most Active Authors\n\n")
+    report.write("| Author | Posts | Comments | Total Karma |\n")
+    report.write("|--------|-------|----------|-------------|\n")
 
+    # Aggregate posts and comments per author separately, then join the two
+    # summaries; joining raw rows on author multiplies posts x comments.
     top_authors = query_db("""
+        WITH pa AS (
+            SELECT author, COUNT(*) as posts, SUM(score) as karma
+            FROM posts
+            WHERE platform = 'voat'
+              AND author NOT IN ('[deleted]', 'AutoModerator')
+            GROUP BY author
+        ),
+        ca AS (
+            SELECT author, COUNT(*) as comments
+            FROM comments
+            WHERE platform = 'voat'
+            GROUP BY author
+        )
         SELECT
-            p.author,
-            COUNT(DISTINCT p.id) as posts,
-            COUNT(DISTINCT c.id) as comments,
-            SUM(p.score) as karma
-        FROM posts p
-        LEFT JOIN comments c ON c.author = p.author AND c.platform = 'voat'
-        WHERE p.platform = 'voat'
-          AND p.author NOT IN ('[deleted]', 'AutoModerator')
-        GROUP BY p.author
-        ORDER BY posts DESC
+            pa.author,
+            pa.posts,
+            COALESCE(ca.comments, 0) as comments,
+            pa.karma
+        FROM pa
+        LEFT JOIN ca USING (author)
+        ORDER BY pa.posts DESC
         LIMIT 20;
     """)
 
-    for line in top_authors.split("\n"):
-        if "|" in line:
-            parts = [p.strip() for p in line.split("|")]
-            if len(parts) >= 4:
-                report.append(f"| {parts[0]} | {int(parts[1]):,} | {int(parts[2]):,} | {int(parts[3]):,} |")
+    for row in top_authors:
+        if len(row) >= 4:
+            report.write(f"| {row[0]} | {int(row[1]):,} | {int(row[2]):,} | {int(row[3]):,} |\n")
 
     # Content type breakdown
-    report.append("\n## Content Type Breakdown\n")
+    report.write("\n## Content Type Breakdown\n\n")
 
     content_types = query_db("""
         SELECT
@@ -157,16 +206,14 @@ def main():
         GROUP BY is_self;
     """)
 
-    for line in content_types.split("\n"):
-        if "|" in line:
-            parts = [p.strip() for p in line.split("|")]
-            if len(parts) >= 2:
-                report.append(f"- **{parts[0]}**: {int(parts[1]):,}")
+    for row in content_types:
+        if len(row) >= 2:
+            report.write(f"- **{row[0]}**: {int(row[1]):,}\n")
 
     # Top domains
-    report.append("\n## Top 20 Linked Domains\n")
-    report.append("| Domain | Link Count |")
-    report.append("|--------|------------|")
+    report.write("\n## Top 20 Linked Domains\n\n")
+    report.write("| Domain | Link Count |\n")
+    report.write("|--------|------------|\n")
 
     top_domains = query_db("""
         SELECT
@@ -181,16 +228,14 @@ def main():
         LIMIT 20;
     """)
 
-    for line in top_domains.split("\n"):
-        if "|" in line:
-            parts = [p.strip() for p in line.split("|")]
-            if len(parts) >= 2:
-                report.append(f"| {parts[0]} | {int(parts[1]):,} |")
+    for row in top_domains:
+        if len(row) >= 2:
+            report.write(f"| {row[0]} | {int(row[1]):,} |\n")
 
     # Monthly activity
-    report.append("\n## Activity by Year\n")
-    report.append("| Year | Posts | Comments |")
-    report.append("|------|-------|----------|")
+    report.write("\n## Activity by Year\n\n")
+    report.write("| Year | Posts | Comments |\n")
+    report.write("|------|-------|----------|\n")
 
     yearly_activity = query_db("""
         SELECT
@@ -204,16 +249,14 @@ def main():
         ORDER BY year;
     """)
 
-    for line in yearly_activity.split("\n"):
-        if "|" in line:
-            parts = [p.strip() for p in line.split("|")]
-            if len(parts) >= 3:
-                report.append(f"| {int(float(parts[0]))} | {int(parts[1]):,} | {int(parts[2]):,} |")
+    for row in yearly_activity:
+        if len(row) >= 3:
+            report.write(f"| {int(float(row[0]))} | {int(row[1]):,} | {int(row[2]):,} |\n")
 
     # Collection statistics
-    report.append("\n## Curated Collection Statistics\n")
-    report.append("| Collection | Subverses | Posts | Comments | Authors |")
-    report.append("|------------|-----------|-------|----------|---------|")
+    report.write("\n## Curated Collection Statistics\n\n")
+    report.write("| Collection | Subverses | Posts | Comments | Authors |\n")
+    report.write("|------------|-----------|-------|----------|---------|\n")
 
     collections = {
         "Technology & Programming": [
@@ -263,59 +306,62 @@ def main():
         "Science & Education": ["science", "space", "askscience", "Physics", "biology", "chemistry"],
     }
 
-    for name, subverses in collections.items():
-        subverse_list = "', '".join(subverses)
-        stats = query_db(f"""
-            SELECT
-                COUNT(DISTINCT p.id) as posts,
-                COUNT(DISTINCT c.id) as comments,
-                COUNT(DISTINCT p.author) as authors
-            FROM posts p
-            LEFT JOIN comments c ON c.post_id = p.id AND c.platform = 'voat'
-            WHERE p.platform = 'voat'
-              AND p.subreddit IN ('{subverse_list}');
-        """)
-
-        if stats:
-            parts = [p.strip() for p in stats.split("|")]
-            if len(parts) >= 3:
-                report.append(
-                    f"| {name} | {len(subverses)} | {int(parts[0]):,} | {int(parts[1]):,} | {int(parts[2]):,} |"
-                )
+    # One aggregation for all collections: subverse -> collection index via a VALUES table
+    mapping = ", ".join(
+        f"({sql_literal(subverse)}, {idx})"
+        for idx, subverses in enumerate(collections.values())
+        for subverse in subverses
+    )
+    collection_stats = query_db(f"""
+        WITH m(subreddit, collection) AS (VALUES {mapping})
+        SELECT
+            m.collection,
+            COUNT(DISTINCT p.id) as posts,
+            COUNT(DISTINCT c.id) as comments,
+            COUNT(DISTINCT p.author) as authors
+        FROM m
+        JOIN posts p ON p.subreddit = m.subreddit AND p.platform = 'voat'
+        LEFT JOIN comments c ON c.post_id = p.id AND c.platform = 'voat'
+        GROUP BY m.collection;
+    """)
+    stats_by_collection = {int(row[0]): row[1:4] for row in collection_stats if len(row) >= 4}
+
+    for idx, (name, subverses) in enumerate(collections.items()):
+        posts, comments, authors = stats_by_collection.get(idx, (0, 0, 0))
+        report.write(f"| {name} | {len(subverses)} | {int(posts):,} | {int(comments):,} | {int(authors):,} |\n")
 
     # Export options
-    report.append("\n## Export Tools\n")
-    report.append("\n### Per-Subverse Export\n")
-    report.append("```bash")
-    report.append("# Export single subverse")
-    report.append("python tools/voat/export_subverse_sql.py --subverse retrogaming")
-    report.append("")
-    report.append("# Export top 10 subverses")
-    report.append("python tools/voat/export_subverse_sql.py --top 10 --min-posts 100 --max-posts 5000")
-    report.append("```\n")
-
-    report.append("### Collection Export\n")
-    report.append("```bash")
-    report.append("# Export gaming collection")
-    report.append("python tools/voat/export_voat_collections.py --collection gaming")
-    report.append("")
-    report.append("# Export all collections")
-    report.append("python tools/voat/export_voat_collections.py --collection all")
-    report.append("```\n")
-
-    report.append("---\n")
-    report.append("\n*Report generated by redd-archiver Voat statistics tool*")
+    report.write("\n## Export Tools\n\n")
+    report.write("\n### Per-Subverse Export\n\n")
+    report.write("```bash\n")
+    report.write("# Export single subverse\n")
+    report.write("python tools/voat/export_subverse_sql.py --subverse retrogaming\n")
+    report.write("\n")
+    report.write("# Export top 10 subverses\n")
+    report.write("python tools/voat/export_subverse_sql.py --top 10 --min-posts 100 --max-posts 5000\n")
+    report.write("```\n\n")
+
+    report.write("### Collection Export\n\n")
+    report.write("```bash\n")
+    report.write("# Export gaming collection\n")
+    report.write("python tools/voat/export_voat_collections.py --collection gaming\n")
+    report.write("\n")
+    report.write("# Export all collections\n")
+    report.write("python tools/voat/export_voat_collections.py --collection all\n")
+    report.write("```\n\n")
+
+    report.write("---\n\n")
+    report.write("\n*Report generated by redd-archiver Voat statistics tool*")
 
     # Save report
-    output_path = "/output/VOAT_ARCHIVE_REPORT.md"
-    with open(output_path, "w") as f:
-        f.write("\n".join(report))
+    with open(OUTPUT_PATH, "w") as f:
+        f.write(report.getvalue())
 
-    print(f"\n✓ Report saved to: {output_path}")
+    if fingerprint:
+        with open(CACHE_PATH, "w") as f:
+            json.dump({"fingerprint": fingerprint, "report": report.getvalue()}, f)
 
-    # Also print to stdout
-    print("\n" + "=" * 70)
-    print("\n".join(report))
+    print(f"\n✓ Report saved to: {OUTPUT_PATH}")
 
 
 if __name__ == "__main__":
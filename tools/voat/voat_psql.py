@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Shared psql connection settings and SQL quoting for the Voat export and report scripts
+ABOUTME: Picks a local psql client over TCP or psql inside the postgres container
+"""
+
+import grp
+import os
+import shutil
+
+# Database connection (direct TCP to the exposed postgres port)
+DB_HOST = "localhost"
+DB_PORT = "5435"
+DB_NAME = "reddarchiver"
+DB_USER = "reddarchiver"
+DB_PASS = "CHANGE_THIS_PASSWORD"
+DB_CONTAINER = "reddarchiver-postgres"
+
+PSQL_ENV = {**os.environ, "PGPASSWORD": os.environ.get("PGPASSWORD", DB_PASS)}
+
+
+def psql_base_command() -> list[str]:
+    """Build the psql argv prefix shared by every query.
+
+    Connects over TCP when a local psql client is available; otherwise runs
+    psql inside the postgres container, adding sudo only when the current
+    user cannot reach the docker daemon on its own.
+    """
+    if shutil.which("psql"):
+        return ["psql", "-h", DB_HOST, "-p", DB_PORT, "-U", DB_USER, "-d", DB_NAME]
+
+    command = ["docker", "exec", DB_CONTAINER, "psql", "-U", DB_USER, "-d", DB_NAME]
+    try:
+        in_docker_group = grp.getgrnam("docker").gr_gid in os.getgroups()
+    except KeyError:
+        in_docker_group = False
+    if os.geteuid() != 0 and not in_docker_group:
+        command = ["sudo", *command]
+    return command
+
+
+PSQL_BASE = psql_base_command()
+
+
+def sql_literal(value: str) -> str:
+    """Quote a string as a SQL literal."""
+    return "'" + value.replace("'", "''") + "'"
@@ -4,48 +4,281 @@ Enhanced console output system for Redd-Archiver.
 Provides professional, clean terminal output without special characters.
 """
 
+import atexit
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import sys
+import threading
 import time
-from datetime import datetime
+from contextlib import contextmanager
+from functools import lru_cache
 
 import psutil
 
+# orjson serializes log records several times faster and already returns UTF-8 bytes
+try:
+    import orjson
+
+    def _dumps_log_entry(log_entry: dict) -> bytes:
+        return orjson.dumps(log_entry)
+
+except ImportError:
+
+    def _dumps_log_entry(log_entry: dict) -> bytes:
+        return json.dumps(log_entry, ensure_ascii=False).encode("utf-8")
+
+
+# Last formatted console timestamp as [epoch_second, text]; the format has
+# one-second resolution, so lines within the same second share one strftime
+_ts_cache = [0, ""]
+
 
 def get_timestamp() -> str:
     """Generate timestamp for console output"""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[0] = now
+        _ts_cache[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+    return _ts_cache[1]
+
+
+# PID stamped on JSON log records; refreshed in forked children
+_PID = os.getpid()
+
+
+def _refresh_pid():
+    global _PID
+    _PID = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_pid)
+
+
+# Last UTC second prefix for JSON log timestamps as [epoch_second, "YYYY-MM-DDTHH:MM:SS"]
+_iso_cache = [0, ""]
+
+
+def _iso_timestamp(created: float) -> str:
+    """Format an epoch time as an ISO-8601 UTC timestamp with microseconds"""
+    seconds = int(created)
+    if seconds != _iso_cache[0]:
+        _iso_cache[0] = seconds
+        _iso_cache[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+    return f"{_iso_cache[1]}.{int((created - seconds) * 1e6):06d}Z"
+
+
+# Indentation prefixes for the common indent levels
+_INDENTS = tuple("  " * i for i in range(16))
+
+
+def _indent_prefix(indent: int) -> str:
+    """Return the whitespace prefix for an indent level"""
+    return _INDENTS[indent] if 0 <= indent < 16 else "  " * indent
+
+
+# Per-thread line buffer used while a summary block is being assembled
+_output_batch = threading.local()
+
+
+def _emit(line: str):
+    """Write one console line with a single write call (no explicit flush)"""
+    lines = getattr(_output_batch, "lines", None)
+    if lines is not None:
+        lines.append(line)
+        return
+    sys.stdout.write(line + "\n")
+
+
+@contextmanager
+def _batched_output():
+    """Collect console lines emitted by this thread and write them in one call on exit"""
+    if getattr(_output_batch, "lines", None) is not None:
+        yield  # Already batching in an outer block
+        return
+    _output_batch.lines = lines = []
+    try:
+        yield
+    finally:
+        _output_batch.lines = None
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Formats tracebacks for log entries built outside a handler's formatter
+_exception_formatter = logging.Formatter()
+
+
+def _context_log_entry(created: float, levelno: int, message: str, ctx: dict | None) -> dict:
+    """Build a structured JSON log entry from its fields"""
+    log_entry = {
+        "timestamp": _iso_timestamp(created),
+        "level": logging.getLevelName(levelno),
+        "message": message,
+        "process_id": _PID,
+    }
+
+    # Add context information if available (attached by ConsoleOutput as one dict)
+    if ctx:
+        log_entry.update(ctx)
+    return log_entry
+
+
+def _build_log_entry(record: logging.LogRecord) -> dict:
+    """Build the structured JSON log entry for a record"""
+    log_entry = _context_log_entry(record.created, record.levelno, record.getMessage(), getattr(record, "ctx", None))
+
+    # Add exception information if present
+    if record.exc_info:
+        log_entry["exception"] = _exception_formatter.formatException(record.exc_info)
+
+    return log_entry
 
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured log files"""
 
     def format(self, record):
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "level": record.levelname,
-            "message": record.getMessage(),
-            "process_id": os.getpid(),
-        }
+        return _dumps_log_entry(_build_log_entry(record)).decode("utf-8")
 
-        # Add context information if available
-        if hasattr(record, "subreddit"):
-            log_entry["subreddit"] = record.subreddit
-        if hasattr(record, "phase"):
-            log_entry["phase"] = record.phase
-        if hasattr(record, "memory_mb"):
-            log_entry["memory_mb"] = record.memory_mb
-        if hasattr(record, "indent"):
-            log_entry["indent"] = record.indent
 
-        # Add exception information if present
-        if record.exc_info:
-            log_entry["exception"] = self.formatException(record.exc_info)
+class _JsonlBytesHandler(logging.handlers.RotatingFileHandler):
+    """Rotating handler that writes encoded JSON lines straight to a binary file.
 
-        return json.dumps(log_entry)
+    Entries are serialized to bytes once and written without the formatter
+    and text-encoding layers, which also makes the in-memory size count used
+    for rollover exact (the stock shouldRollover() seeks to the end of the
+    file and formats every record a second time). The file is flushed every
+    FLUSH_EVERY records, after FLUSH_INTERVAL seconds, on ERROR and above, and
+    by _FileLogListener whenever its queue runs empty.
+    """
+
+    FLUSH_EVERY = 64
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        self._bytes_written = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+
+    def _open(self):
+        return open(self.baseFilename, "ab")
+
+    def shouldRollover(self, record):  # noqa: N802
+        return self._rollover_due(0)
+
+    def _rollover_due(self, size: int) -> bool:
+        """Whether appending size bytes would take a non-empty file past maxBytes"""
+        return self.maxBytes > 0 and self._bytes_written > 0 and self._bytes_written + size > self.maxBytes
+
+    def doRollover(self):  # noqa: N802
+        super().doRollover()
+        self._bytes_written = 0
+
+    def _write_entry(self, log_entry: dict, levelno: int):
+        """Append one encoded entry, rolling over and flushing as needed"""
+        payload = _dumps_log_entry(log_entry) + b"\n"
+        if self._rollover_due(len(payload)):
+            self.doRollover()
+        if self.stream is None:
+            self.stream = self._open()
+        self.stream.write(payload)
+        self._bytes_written += len(payload)
+        self._unflushed += 1
+
+        now = time.monotonic()
+        if (
+            levelno >= logging.ERROR
+            or self._unflushed >= self.FLUSH_EVERY
+            or now - self._last_flush >= self.FLUSH_INTERVAL
+        ):
+            self._flush_stream(now)
+
+    def _flush_stream(self, now: float):
+        if self.stream is not None and self._unflushed:
+            self.stream.flush()
+        self._unflushed = 0
+        self._last_flush = now
+
+    def flush(self):
+        with self.lock:
+            self._flush_stream(time.monotonic())
+
+    def emit(self, record):
+        try:
+            self._write_entry(_build_log_entry(record), record.levelno)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def handle_fields(self, fields: tuple):
+        """Write a (created, levelno, message, ctx) entry queued by the fast log path"""
+        created, levelno, message, ctx = fields
+        with self.lock:
+            try:
+                self._write_entry(_context_log_entry(created, levelno, message, ctx), levelno)
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(logging.makeLogRecord({"msg": message, "levelno": levelno, "created": created}))
+
+
+class _PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records untouched.
+
+    The stock prepare() formats the record on the calling thread and drops
+    exc_info, which would both defeat the purpose of the queue and flatten
+    tracebacks into the message. Records stay in-process, so no pickling
+    preparation is needed.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class _FileLogListener(logging.handlers.QueueListener):
+    """QueueListener that also accepts bare field tuples from ConsoleOutput's fast log path.
+
+    Handlers are flushed whenever the queue runs empty, so buffered entries reach
+    the file before the writer goes idle instead of waiting for the next record.
+    """
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                handler.flush()
+            return self.queue.get(block)
+
+    def handle(self, record):
+        if type(record) is tuple:
+            for handler in self.handlers:
+                handler.handle_fields(record)
+        else:
+            super().handle(record)
+
+
+# Background listener that writes queued records to the rotating log file
+_file_log_listener = None
+
+
+def _stop_file_log_listener():
+    """Flush queued records and stop the background log writer"""
+    global _file_log_listener
+    if _file_log_listener is not None:
+        _file_log_listener.stop()
+        for handler in _file_log_listener.handlers:
+            handler.close()
+        _file_log_listener = None
+
+
+atexit.register(_stop_file_log_listener)
 
 
 def setup_file_logging(
@@ -54,6 +287,9 @@ def setup_file_logging(
     """
     Setup rotating file logger for error logging
 
+    Records are handed to a queue and written by a background thread, so
+    callers never wait on JSON encoding or disk I/O.
+
     Args:
         log_file_path: Path to the log file
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -63,10 +299,22 @@ def setup_file_logging(
     Returns:
         Configured logger instance
     """
+    global _file_log_listener
+
     logger = logging.getLogger("redd-archiver")
     logger.setLevel(getattr(logging, log_level.upper()))
 
-    # Clear any existing handlers
+    # Reuse the running writer when it already targets the same file and rotation
+    handler_key = (os.path.abspath(log_file_path), max_bytes, backup_count)
+    if _file_log_listener is not None and any(
+        getattr(handler, "_redd_key", None) == handler_key for handler in logger.handlers
+    ):
+        return logger
+
+    # Clear any existing handlers (and the writer thread feeding the old file)
+    _stop_file_log_listener()
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
 
     # Create directory if it doesn't exist (handle edge cases)
@@ -82,13 +330,16 @@ def setup_file_logging(
         os.makedirs(log_dir, exist_ok=True)
 
     # Setup rotating file handler
-    file_handler = logging.handlers.RotatingFileHandler(
-        log_file_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
-    )
+    # Writes structured JSON lines as bytes (no text formatter involved)
+    file_handler = _JsonlBytesHandler(log_file_path, maxBytes=max_bytes, backupCount=backup_count)
 
-    # Use JSON formatter for structured logging
-    file_handler.setFormatter(JSONFormatter())
-    logger.addHandler(file_handler)
+    # Formatting and writing happen on the listener thread
+    log_queue = queue.SimpleQueue()
+    _file_log_listener = _FileLogListener(log_queue, file_handler)
+    _file_log_listener.start()
+    queue_handler = _PassthroughQueueHandler(log_queue)
+    queue_handler._redd_key = handler_key
+    logger.addHandler(queue_handler)
 
     # Prevent propagation to avoid duplicate messages
     logger.propagate = False
@@ -99,21 +350,42 @@ def setup_file_logging(
 class ProgressTracker:
     """Simple progress tracking without external dependencies"""
 
-    def __init__(self, total: int, description: str = "", width: int = 50):
+    # Re-query the terminal width every N redraws instead of on each one
+    TERMINAL_WIDTH_REFRESH = 50
+
+    def __init__(self, total: int, description: str = "", width: int = 50, min_interval: float = 0.1):
         self.total = total
         self.current = 0
         self.description = description
         self.width = width
-        self.start_time = time.time()
-        self.last_update = 0
+        # Full-width fill and empty segments; each redraw slices them
+        self._bar_full = "=" * width
+        self._bar_empty = "-" * width
+        self.min_interval = min_interval
+        self.start_time = time.monotonic()
+        self.last_update = 0.0
+        self._redraws = 0
+        self._terminal_width = None
+        self._is_tty = sys.stdout.isatty()
+
+    def _get_terminal_width(self):
+        """Return the cached terminal width, refreshing it periodically"""
+        if self._redraws % self.TERMINAL_WIDTH_REFRESH == 0:
+            try:
+                self._terminal_width = os.get_terminal_size().columns
+            except OSError:
+                self._terminal_width = None
+            self._is_tty = sys.stdout.isatty()
+        self._redraws += 1
+        return self._terminal_width
 
     def update(self, current: int, suffix: str = ""):
         """Update progress bar"""
         self.current = current
 
-        # Throttle updates to prevent spam
-        now = time.time()
-        if now - self.last_update < 0.1 and current < self.total:
+        # Throttle updates to prevent spam (before any formatting work)
+        now = time.monotonic()
+        if now - self.last_update < self.min_interval and current < self.total:
             return
         self.last_update = now
 
@@ -126,7 +398,7 @@ class ProgressTracker:
             filled = 0
 
         # Create progress bar
-        bar = "[" + "=" * filled + "-" * (self.width - filled) + "]"
+        bar = "[" + self._bar_full[:filled] + self._bar_empty[filled:] + "]"
 
         # Calculate ETA
         elapsed = now - self.start_time
@@ -141,56 +413,83 @@ class ProgressTracker:
         output = f"\r{self.description} {bar} {current}/{self.total} ({percent:.1f}%){eta} {suffix}"
 
         # Ensure we don't exceed terminal width
-        try:
-            terminal_width = os.get_terminal_size().columns
-            if len(output) > terminal_width:
-                output = output[: terminal_width - 3] + "..."
-        except:
-            pass
+        terminal_width = self._get_terminal_width()
+        if terminal_width and len(output) > terminal_width:
+            output = output[: terminal_width - 3] + "..."
 
         sys.stdout.write(output)
-        sys.stdout.flush()
+        # Partial lines only need pushing out when someone is watching
+        if self._is_tty:
+            sys.stdout.flush()
 
         if current >= self.total:
-            print()  # New line when complete
+            sys.stdout.write("\n")  # New line when complete
 
     def finish(self, message: str = "Complete"):
         """Mark progress as finished"""
-        elapsed = time.time() - self.start_time
-        print(f"\r{self.description} [{message}] {self.total}/{self.total} in {format_duration(elapsed)}")
+        elapsed = time.monotonic() - self.start_time
+        _emit(f"\r{self.description} [{message}] {self.total}/{self.total} in {format_duration(elapsed)}")
 
 
 def format_duration(seconds: float) -> str:
     """Format duration in human readable format"""
     if seconds < 60:
         return f"{seconds:.1f}s"
-    elif seconds < 3600:
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{minutes}m {secs}s"
-    else:
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        return f"{hours}h {minutes}m"
+    return _format_whole_duration(int(seconds))
+
+
+@lru_cache(maxsize=1024)
+def _format_whole_duration(total: int) -> str:
+    """Format a duration of a minute or more, truncated to whole seconds"""
+    hours, rem = divmod(total, 3600)
+    minutes, secs = divmod(rem, 60)
+    return f"{hours}h {minutes}m" if hours else f"{minutes}m {secs}s"
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 
 def format_size(bytes_value: int) -> str:
     """Format file size in human readable format"""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f} PB"
+    # Each unit is 2**10 of the previous one, so the unit index is bit_length // 10
+    unit_idx = 0 if bytes_value <= 0 else min((int(bytes_value).bit_length() - 1) // 10, 5)
+    return f"{bytes_value / (1 << (10 * unit_idx)):.1f} {_SIZE_UNITS[unit_idx]}"
 
 
+@lru_cache(maxsize=4096, typed=True)
 def format_number(num: int) -> str:
     """Format number with thousands separators"""
     return f"{num:,}"
 
 
+def _fast_log_queue(logger: logging.Logger):
+    """Return the writer queue when the file logger is exactly as setup_file_logging built it.
+
+    Entries can then skip LogRecord construction and go straight to the
+    JSONL writer; any extra filter or handler disables the shortcut.
+    """
+    if logger.filters or len(logger.handlers) != 1 or _file_log_listener is None:
+        return None
+    queue_handler = logger.handlers[0]
+    if not isinstance(queue_handler, _PassthroughQueueHandler) or queue_handler.filters:
+        return None
+    if queue_handler.queue is not _file_log_listener.queue:
+        return None
+    for handler in _file_log_listener.handlers:
+        if not isinstance(handler, _JsonlBytesHandler) or handler.filters or handler.level:
+            return None
+    return queue_handler.queue
+
+
+def _no_file_log(*args, **kwargs):
+    """Stand-in for ConsoleOutput._log_to_file while file logging is not set up"""
+
+
 class ConsoleOutput:
     """Main console output manager for Redd-Archiver"""
 
+    MEMORY_SAMPLE_INTERVAL = 0.5
+
     def __init__(self, verbose: bool = True):
         self.verbose = verbose
         self.start_time = time.time()
@@ -198,6 +497,14 @@ class ConsoleOutput:
         self.current_subreddit = None
         self.current_phase = None
         self.file_logger = None
+        # Console calls go straight to a no-op until setup_file_logging() swaps in the real writer
+        self._log_to_file = _no_file_log
+
+        # Process handle and last RSS sample as (monotonic time, MB); memory is
+        # attached to every file log record, so it is sampled at most every
+        # MEMORY_SAMPLE_INTERVAL seconds rather than read from /proc per record
+        self._process = psutil.Process()
+        self._memory_sample = (0.0, 0.0)
 
         # Performance-first defaults
         self.performance_mode = True
@@ -229,6 +536,8 @@ class ConsoleOutput:
         """Setup file logging for this console instance"""
         self.file_logger = setup_file_logging(log_file_path, log_level)
         self.log_file_path = log_file_path
+        self._fast_log_queue = _fast_log_queue(self.file_logger)
+        self._log_to_file = self._log_to_file_fast if self._fast_log_queue is not None else self._log_to_file_impl
 
     def set_context(self, subreddit: str = None, phase: str = None):
         """Set context information for logging"""
@@ -237,15 +546,41 @@ class ConsoleOutput:
         if phase is not None:
             self.current_phase = phase
 
-    def _log_to_file(self, level: str, message: str, indent: int = 0, exc_info=None):
+    def _log_context(self, indent: int) -> dict:
+        """Collect the context fields attached to every file log entry"""
+        ctx = {}
+        if self.current_subreddit:
+            ctx["subreddit"] = self.current_subreddit
+        if self.current_phase:
+            ctx["phase"] = self.current_phase
+
+        # Add memory information if possible
+        try:
+            ctx["memory_mb"] = round(self._get_memory_mb(), 1)
+        except:
+            pass
+
+        if indent > 0:
+            ctx["indent"] = indent
+        return ctx
+
+    def _log_to_file_fast(self, level: int, message: str, indent: int = 0, exc_info=None):
+        """Queue entry fields straight to the file log writer, skipping LogRecord and handler dispatch"""
+        if exc_info is not None:
+            self._log_to_file_impl(level, message, indent, exc_info)
+        elif self.file_logger.isEnabledFor(level):
+            self._fast_log_queue.put((time.time(), level, message, self._log_context(indent)))
+
+    def _log_to_file_impl(self, level: int, message: str, indent: int = 0, exc_info=None):
         """Internal method to log to file with context"""
-        if not self.file_logger:
+        # Bail out before building the record when the level is filtered anyway
+        if not self.file_logger or not self.file_logger.isEnabledFor(level):
             return
 
         # Create log record with context
         record = logging.LogRecord(
             name="redd-archiver",
-            level=getattr(logging, level.upper()),
+            level=level,
             pathname="",
             lineno=0,
             msg=message,
@@ -253,75 +588,66 @@ class ConsoleOutput:
             exc_info=exc_info,
         )
 
-        # Add context information
-        if self.current_subreddit:
-            record.subreddit = self.current_subreddit
-        if self.current_phase:
-            record.phase = self.current_phase
-        if indent > 0:
-            record.indent = indent
-
-        # Add memory information if possible
-        try:
-            process = psutil.Process()
-            memory_mb = process.memory_info().rss / 1024 / 1024
-            record.memory_mb = round(memory_mb, 1)
-        except:
-            pass
+        # Add context information as a single dict the formatter merges in one step
+        record.ctx = self._log_context(indent)
 
         self.file_logger.handle(record)
 
+    def _get_memory_mb(self) -> float:
+        """Return process RSS in MB, re-sampled at most every MEMORY_SAMPLE_INTERVAL"""
+        now = time.monotonic()
+        if now - self._memory_sample[0] > self.MEMORY_SAMPLE_INTERVAL:
+            self._memory_sample = (now, self._process.memory_info().rss / 1048576)
+        return self._memory_sample[1]
+
     def header(self, title: str):
         """Print a major section header"""
-        print()
-        print("=" * 80)
-        print(f" {title}")
-        print("=" * 80)
+        rule = "=" * 80
+        _emit(f"\n{rule}\n {title}\n{rule}")
 
     def section(self, title: str):
         """Print a section header"""
-        print()
         timestamp = get_timestamp()
-        print(f"[{timestamp}] --- {title} ---")
+        _emit(f"\n[{timestamp}] --- {title} ---")
 
     def info(self, message: str, indent: int = 0):
         """Print general information"""
-        prefix = "  " * indent
+        prefix = _indent_prefix(indent)
         timestamp = get_timestamp()
-        print(f"[{timestamp}] {prefix}{message}")
-        self._log_to_file("INFO", message, indent)
+        _emit(f"[{timestamp}] {prefix}{message}")
+        self._log_to_file(logging.INFO, message, indent)
 
     def success(self, message: str, indent: int = 0):
         """Print success message"""
-        prefix = "  " * indent
+        prefix = _indent_prefix(indent)
         timestamp = get_timestamp()
-        print(f"[{timestamp}] {prefix}[SUCCESS] {message}")
-        self._log_to_file("INFO", f"[SUCCESS] {message}", indent)
+        _emit(f"[{timestamp}] {prefix}[SUCCESS] {message}")
+        self._log_to_file(logging.INFO, f"[SUCCESS] {message}", indent)
 
     def warning(self, message: str, indent: int = 0):
         """Print warning message"""
-        prefix = "  " * indent
+        prefix = _indent_prefix(indent)
         timestamp = get_timestamp()
-        print(f"[{timestamp}] {prefix}[WARNING] {message}")
+        _emit(f"[{timestamp}] {prefix}[WARNING] {message}")
         self.stats["warnings"] += 1
-        self._log_to_file("WARNING", message, indent)
+        self._log_to_file(logging.WARNING, message, indent)
 
     def error(self, message: str, indent: int = 0, exc_info=None):
         """Print error message"""
-        prefix = "  " * indent
+        prefix = _indent_prefix(indent)
         timestamp = get_timestamp()
-        print(f"[{timestamp}] {prefix}[ERROR] {message}")
+        _emit(f"[{timestamp}] {prefix}[ERROR] {message}")
         self.stats["errors"] += 1
-        self._log_to_file("ERROR", message, indent, exc_info)
+        self._log_to_file(logging.ERROR, message, indent, exc_info)
 
     def debug(self, message: str, indent: int = 0):
         """Print debug message (only if verbose)"""
         if self.verbose:
-            prefix = "  " * indent
+            prefix = _indent_prefix(indent)
             timestamp = get_timestamp()
-            print(f"[{timestamp}] {prefix}[DEBUG] {message}")
+            _emit(f"[{timestamp}] {prefix}[DEBUG] {message}")
         # Always log debug messages to file if logger is available
-        self._log_to_file("DEBUG", message, indent)
+        self._log_to_file(logging.DEBUG, message, indent)
 
     def progress_bar(self, total: int, description: str = "") -> ProgressTracker:
         """Create a new progress tracker"""
@@ -330,13 +656,11 @@ class ConsoleOutput:
     def memory_status(self):
         """Show current memory usage"""
         try:
-            process = psutil.Process()
-            memory = process.memory_info()
-            memory_mb = memory.rss / 1024 / 1024
+            memory_mb = self._process.memory_info().rss / 1048576
 
             # Get memory percentage if possible
             try:
-                memory_percent = process.memory_percent()
+                memory_percent = self._process.memory_percent()
                 self.info(f"Memory usage: {memory_mb:.1f} MB ({memory_percent:.1f}%)")
             except:
                 self.info(f"Memory usage: {memory_mb:.1f} MB")
@@ -347,25 +671,29 @@ class ConsoleOutput:
         """Show processing statistics"""
         elapsed = time.time() - self.start_time
 
-        print()
-        print("Processing Statistics:")
-        print(f"  Runtime: {format_duration(elapsed)}")
-        print(f"  Subreddits: {format_number(self.stats['subreddits_processed'])}")
-        print(f"  Posts: {format_number(self.stats['posts_processed'])}")
-        print(f"  Comments: {format_number(self.stats['comments_processed'])}")
-        print(f"  Files written: {format_number(self.stats['files_written'])}")
+        lines = [
+            "",
+            "Processing Statistics:",
+            f"  Runtime: {format_duration(elapsed)}",
+            f"  Subreddits: {format_number(self.stats['subreddits_processed'])}",
+            f"  Posts: {format_number(self.stats['posts_processed'])}",
+            f"  Comments: {format_number(self.stats['comments_processed'])}",
+            f"  Files written: {format_number(self.stats['files_written'])}",
+        ]
 
         if self.stats["bytes_processed"] > 0:
-            print(f"  Data processed: {format_size(self.stats['bytes_processed'])}")
+            lines.append(f"  Data processed: {format_size(self.stats['bytes_processed'])}")
 
         if elapsed > 0:
             posts_per_sec = self.stats["posts_processed"] / elapsed
-            print(f"  Processing rate: {posts_per_sec:.1f} posts/second")
+            lines.append(f"  Processing rate: {posts_per_sec:.1f} posts/second")
 
         if self.stats["errors"] > 0:
-            print(f"  Errors: {self.stats['errors']}")
+            lines.append(f"  Errors: {self.stats['errors']}")
         if self.stats["warnings"] > 0:
-            print(f"  Warnings: {self.stats['warnings']}")
+            lines.append(f"  Warnings: {self.stats['warnings']}")
+
+        _emit("\n".join(lines))
 
     def update_stats(self, **kwargs):
         """Update processing statistics"""
@@ -375,13 +703,17 @@ class ConsoleOutput:
 
     def subreddit_summary(self, name: str, posts: int, comments: int, processed_posts: int, processed_comments: int):
         """Show subreddit processing summary"""
-        print(f"  r/{name}:")
-        print(f"    Posts: {format_number(processed_posts)}/{format_number(posts)} processed")
-        print(f"    Comments: {format_number(processed_comments)}/{format_number(comments)} processed")
+        lines = [
+            f"  r/{name}:",
+            f"    Posts: {format_number(processed_posts)}/{format_number(posts)} processed",
+            f"    Comments: {format_number(processed_comments)}/{format_number(comments)} processed",
+        ]
 
         if posts > 0:
             post_percent = (processed_posts / posts) * 100
-            print(f"    Post rate: {post_percent:.1f}%")
+            lines.append(f"    Post rate: {post_percent:.1f}%")
+
+        _emit("\n".join(lines))
 
     def phase_start(self, phase_name: str, description: str = ""):
         """Start a new processing phase"""
@@ -436,6 +768,7 @@ class ConsoleOutput:
             indent=1,
         )
 
+    @_batched_output()
     def user_page_performance_summary(self, user_metrics):
         """Step 4.1: Display comprehensive user page build performance summary"""
         if not user_metrics:
@@ -526,7 +859,7 @@ class ConsoleOutput:
         # Performance comparison (if previous data available)
         self._show_performance_comparison(user_metrics)
 
-        print()
+        _emit("")
 
     def _show_performance_comparison(self, user_metrics):
         """Show performance comparison with previous runs if available"""
@@ -553,6 +886,7 @@ class ConsoleOutput:
 
         self.info(f"🎯 70% improvement target: {target_duration} ({target_rate:.1f} users/sec)", indent=2)
 
+    @_batched_output()
     def phase_performance_summary(self, phase_summary):
         """Step 4.1: Display processing phase performance summary"""
         if not phase_summary or phase_summary["total_phases"] == 0:
@@ -605,6 +939,7 @@ class ConsoleOutput:
                 )
                 self.success(f"Performance improved by {improvement_percent:.1f}%", indent=1)
 
+    @_batched_output()
     def final_summary(self, output_dir: str, total_size: int = 0):
         """Show final processing summary"""
         self.header("Processing Complete")
@@ -622,9 +957,7 @@ class ConsoleOutput:
         if self.performance_mode:
             self.show_performance_optimization_info()
 
-        print()
-        print("Archive ready for use!")
-        print(f"Open: {output_dir}/r/index.html")
+        _emit(f"\nArchive ready for use!\nOpen: {output_dir}/r/index.html")
 
 
 # Global console instance
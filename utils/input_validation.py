@@ -5,7 +5,9 @@ ABOUTME: Enforces length limits, format validation, and sanitization to prevent
 """
 
 import re
+import string
 from dataclasses import dataclass
+from functools import lru_cache
 
 # ============================================================================
 # VALIDATION CONSTANTS (based on Reddit's actual limits)
@@ -21,16 +23,149 @@ MIN_LIMIT = 10  # Minimum results per page
 MAX_OFFSET = 10000  # Maximum pagination offset (prevent abuse)
 MAX_PAGE_NUMBER = 1000  # Maximum page number (prevent deep pagination abuse)
 
-# Valid patterns (Reddit's actual format rules)
+# Whitelisted result types and sort options
+VALID_RESULT_TYPES = frozenset({"post", "comment"})
+VALID_SORT_OPTIONS = frozenset(
+    {
+        "rank",
+        "relevance",
+        "score",
+        "date",
+        "created_utc",
+        "created_utc_asc",
+        "new",
+        "newest",
+        "old",
+        "oldest",
+    }
+)
+# Sanitized value of each optional validate_all() field when it is None
+# (mirrors the None branch of the matching validator)
+UNSET_FIELD_DEFAULTS = {
+    "subreddit": None,
+    "author": None,
+    "min_score": 0,
+    "limit": 25,
+    "offset": 0,
+    "result_type": None,
+    "sort_by": "rank",
+}
+_INVALID_SORT_MESSAGE = f"Invalid sort option (must be one of: {', '.join(sorted(VALID_SORT_OPTIONS))})"
+
+# Valid patterns (Reddit's actual format rules); the validators apply the
+# equivalent length gate + allowed-character set check instead of running the regex
 SUBREDDIT_PATTERN = re.compile(r"^[a-zA-Z0-9_]{2,21}$")
 AUTHOR_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{3,20}$")
 
+# ASCII control characters other than tab, newline, and carriage return
+CONTROL_CHAR_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+# Characters allowed by SUBREDDIT_PATTERN / AUTHOR_PATTERN
+SUBREDDIT_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+AUTHOR_CHARS = SUBREDDIT_CHARS | {"-"}
+
+
+def _as_int(value) -> int | None:
+    """Return value as a plain int, or None for bools and values int() cannot convert."""
+    if type(value) is int:
+        return value
+    if isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# ============================================================================
+# CACHED FIELD VALIDATORS
+# ============================================================================
+
+# Subreddit, author, result type and sort values repeat heavily across
+# requests; results are immutable tuples, so they are memoized per value.
+
+
+@lru_cache(maxsize=4096)
+def _validate_subreddit(subreddit: str | None) -> tuple[bool, str | None, str | None]:
+    """Cached implementation of SearchInputValidator.validate_subreddit."""
+    if not subreddit:
+        return True, None, None  # Optional field
+
+    subreddit = subreddit.strip()
+
+    # Check length
+    if len(subreddit) > MAX_SUBREDDIT_LENGTH:
+        return False, None, f"Subreddit name too long (max {MAX_SUBREDDIT_LENGTH} characters)"
+
+    if len(subreddit) < 2:
+        return False, None, "Subreddit name too short (min 2 characters)"
+
+    # Check format (alphanumeric + underscore only, per Reddit rules)
+    if not SUBREDDIT_CHARS.issuperset(subreddit):
+        return False, None, "Invalid subreddit name (only letters, numbers, underscore allowed)"
+
+    return True, subreddit, None
+
+
+@lru_cache(maxsize=4096)
+def _validate_author(author: str | None) -> tuple[bool, str | None, str | None]:
+    """Cached implementation of SearchInputValidator.validate_author."""
+    if not author:
+        return True, None, None  # Optional field
+
+    author = author.strip()
+
+    # Check length
+    if len(author) > MAX_AUTHOR_LENGTH:
+        return False, None, f"Username too long (max {MAX_AUTHOR_LENGTH} characters)"
+
+    if len(author) < 3:
+        return False, None, "Username too short (min 3 characters)"
+
+    # Check format (alphanumeric + underscore + hyphen, per Reddit rules)
+    if not AUTHOR_CHARS.issuperset(author):
+        return False, None, "Invalid username (only letters, numbers, underscore, hyphen allowed)"
+
+    return True, author, None
+
+
+@lru_cache(maxsize=4096)
+def _validate_result_type(result_type: str | None) -> tuple[bool, str | None, str | None]:
+    """Cached implementation of SearchInputValidator.validate_result_type."""
+    if not result_type:
+        return True, None, None  # Optional field
+
+    result_type = result_type.strip().lower()
+
+    # Check against whitelist
+    if result_type not in VALID_RESULT_TYPES:
+        return False, None, "Invalid result type (must be 'post' or 'comment')"
+
+    return True, result_type, None
+
+
+@lru_cache(maxsize=4096)
+def _validate_sort_by(sort_by: str | None) -> tuple[bool, str | None, str | None]:
+    """Cached implementation of SearchInputValidator.validate_sort_by."""
+    if not sort_by:
+        return True, "rank", None  # Default to relevance
+
+    sort_by = sort_by.strip().lower()
+
+    # Check against whitelist
+    if sort_by not in VALID_SORT_OPTIONS:
+        return False, None, _INVALID_SORT_MESSAGE
+
+    return True, sort_by, None
+
+
 # ============================================================================
 # VALIDATION RESULT CLASSES
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationError:
     """Validation error with field and message."""
 
@@ -41,7 +176,7 @@ class ValidationError:
         return f"{self.field}: {self.message}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of input validation."""
 
@@ -76,30 +211,24 @@ class SearchInputValidator:
         Returns:
             Tuple of (is_valid, sanitized_query, error_message)
         """
-        if not query:
-            # Empty query is allowed - will be converted to wildcard in search_server.py
-            return True, "", None
-
-        # Strip whitespace
-        query = query.strip()
+        # Strip whitespace (None and whitespace-only queries both end up empty)
+        query = query.strip() if query else ""
 
         if not query:
-            # Empty query after stripping is allowed - will be converted to wildcard
+            # Empty query is allowed - will be converted to wildcard in search_server.py
             return True, "", None
 
         # Check length
         if len(query) > MAX_QUERY_LENGTH:
             return False, query[:MAX_QUERY_LENGTH], f"Query too long (max {MAX_QUERY_LENGTH} characters)"
 
-        # Check for null bytes (security - can cause issues in C libraries)
-        if "\x00" in query:
-            return False, None, "Query contains invalid characters"
-
-        # Check for control characters (except newline/tab which might be in quotes)
-        control_chars = [chr(i) for i in range(32) if i not in (9, 10, 13)]
-        for char in control_chars:
-            if char in query:
-                return False, None, "Query contains invalid control characters"
+        # Check for control characters (except newline/tab which might be in quotes);
+        # the class includes the null byte, so clean queries are scanned only once
+        if CONTROL_CHAR_PATTERN.search(query):
+            # Null bytes get their own message (security - can cause issues in C libraries)
+            if "\x00" in query:
+                return False, None, "Query contains invalid characters"
+            return False, None, "Query contains invalid control characters"
 
         return True, query, None
 
@@ -113,23 +242,7 @@ class SearchInputValidator:
         Returns:
             Tuple of (is_valid, sanitized_subreddit, error_message)
         """
-        if not subreddit:
-            return True, None, None  # Optional field
-
-        subreddit = subreddit.strip()
-
-        # Check length
-        if len(subreddit) > MAX_SUBREDDIT_LENGTH:
-            return False, None, f"Subreddit name too long (max {MAX_SUBREDDIT_LENGTH} characters)"
-
-        if len(subreddit) < 2:
-            return False, None, "Subreddit name too short (min 2 characters)"
-
-        # Check format (alphanumeric + underscore only, per Reddit rules)
-        if not SUBREDDIT_PATTERN.match(subreddit):
-            return False, None, "Invalid subreddit name (only letters, numbers, underscore allowed)"
-
-        return True, subreddit, None
+        return _validate_subreddit(subreddit)
 
     def validate_author(self, author: str | None) -> tuple[bool, str | None, str | None]:
         """
@@ -141,23 +254,7 @@ class SearchInputValidator:
         Returns:
             Tuple of (is_valid, sanitized_author, error_message)
         """
-        if not author:
-            return True, None, None  # Optional field
-
-        author = author.strip()
-
-        # Check length
-        if len(author) > MAX_AUTHOR_LENGTH:
-            return False, None, f"Username too long (max {MAX_AUTHOR_LENGTH} characters)"
-
-        if len(author) < 3:
-            return False, None, "Username too short (min 3 characters)"
-
-        # Check format (alphanumeric + underscore + hyphen, per Reddit rules)
-        if not AUTHOR_PATTERN.match(author):
-            return False, None, "Invalid username (only letters, numbers, underscore, hyphen allowed)"
-
-        return True, author, None
+        return _validate_author(author)
 
     def validate_score(self, score: int | None) -> tuple[bool, int | None, str | None]:
         """
@@ -172,12 +269,10 @@ class SearchInputValidator:
         if score is None:
             return True, 0, None  # Default to 0
 
-        # Type check
-        if not isinstance(score, int):
-            try:
-                score = int(score)
-            except (ValueError, TypeError):
-                return False, None, "Score must be an integer"
+        # Type check (bools are ints to Python but never a valid score)
+        score = _as_int(score)
+        if score is None:
+            return False, None, "Score must be an integer"
 
         # Check range
         if score < MIN_SCORE_VALUE or score > MAX_SCORE_VALUE:
@@ -198,12 +293,10 @@ class SearchInputValidator:
         if limit is None:
             return True, 25, None  # Default to 25
 
-        # Type check
-        if not isinstance(limit, int):
-            try:
-                limit = int(limit)
-            except (ValueError, TypeError):
-                return False, None, "Limit must be an integer"
+        # Type check (bools are ints to Python but never a valid limit)
+        limit = _as_int(limit)
+        if limit is None:
+            return False, None, "Limit must be an integer"
 
         # Check range
         if limit < MIN_LIMIT or limit > MAX_LIMIT:
@@ -224,12 +317,10 @@ class SearchInputValidator:
         if offset is None:
             return True, 0, None  # Default to 0
 
-        # Type check
-        if not isinstance(offset, int):
-            try:
-                offset = int(offset)
-            except (ValueError, TypeError):
-                return False, None, "Offset must be an integer"
+        # Type check (bools are ints to Python but never a valid offset)
+        offset = _as_int(offset)
+        if offset is None:
+            return False, None, "Offset must be an integer"
 
         # Check range (prevent deep pagination abuse)
         if offset < 0 or offset > MAX_OFFSET:
@@ -251,12 +342,10 @@ class SearchInputValidator:
         if page is None:
             return True, 0, None  # Default to page 1 (offset 0)
 
-        # Type check
-        if not isinstance(page, int):
-            try:
-                page = int(page)
-            except (ValueError, TypeError):
-                return False, None, "Page must be an integer"
+        # Type check (bools are ints to Python but never a valid page)
+        page = _as_int(page)
+        if page is None:
+            return False, None, "Page must be an integer"
 
         # Check range
         if page < 1:
@@ -284,17 +373,7 @@ class SearchInputValidator:
         Returns:
             Tuple of (is_valid, sanitized_type, error_message)
         """
-        if not result_type:
-            return True, None, None  # Optional field
-
-        result_type = result_type.strip().lower()
-
-        # Check against whitelist
-        valid_types = {"post", "comment"}
-        if result_type not in valid_types:
-            return False, None, "Invalid result type (must be 'post' or 'comment')"
-
-        return True, result_type, None
+        return _validate_result_type(result_type)
 
     def validate_sort_by(self, sort_by: str | None) -> tuple[bool, str | None, str | None]:
         """
@@ -306,28 +385,7 @@ class SearchInputValidator:
         Returns:
             Tuple of (is_valid, sanitized_sort, error_message)
         """
-        if not sort_by:
-            return True, "rank", None  # Default to relevance
-
-        sort_by = sort_by.strip().lower()
-
-        # Check against whitelist
-        valid_sorts = {
-            "rank",
-            "relevance",
-            "score",
-            "date",
-            "created_utc",
-            "created_utc_asc",
-            "new",
-            "newest",
-            "old",
-            "oldest",
-        }
-        if sort_by not in valid_sorts:
-            return False, None, f"Invalid sort option (must be one of: {', '.join(sorted(valid_sorts))})"
-
-        return True, sort_by, None
+        return _validate_sort_by(sort_by)
 
     def validate_all(
         self,
@@ -361,41 +419,26 @@ class SearchInputValidator:
         errors = []
         sanitized = {}
 
-        # Validate query (optional for API list endpoints, required for search)
-        if query is not None:
-            valid, sanitized_query, error = self.validate_query(query)
-            if not valid:
-                errors.append(ValidationError("query", error))
+        def apply(field: str, validate, value) -> None:
+            if value is None:
+                # Unset optional field: skip the validator call entirely
+                sanitized[field] = UNSET_FIELD_DEFAULTS[field]
+                return
+            valid, clean, error = validate(value)
+            if valid:
+                sanitized[field] = clean
             else:
-                sanitized["query"] = sanitized_query
-
-        # Validate subreddit (optional)
-        valid, sanitized_sub, error = self.validate_subreddit(subreddit)
-        if not valid:
-            errors.append(ValidationError("subreddit", error))
-        else:
-            sanitized["subreddit"] = sanitized_sub
-
-        # Validate author (optional)
-        valid, sanitized_auth, error = self.validate_author(author)
-        if not valid:
-            errors.append(ValidationError("author", error))
-        else:
-            sanitized["author"] = sanitized_auth
+                errors.append(ValidationError(field, error))
 
-        # Validate score (optional)
-        valid, sanitized_score, error = self.validate_score(min_score)
-        if not valid:
-            errors.append(ValidationError("min_score", error))
-        else:
-            sanitized["min_score"] = sanitized_score
+        # Validate query (optional for API list endpoints, required for search)
+        if query is not None:
+            apply("query", self.validate_query, query)
 
-        # Validate limit (optional)
-        valid, sanitized_limit, error = self.validate_limit(limit)
-        if not valid:
-            errors.append(ValidationError("limit", error))
-        else:
-            sanitized["limit"] = sanitized_limit
+        # Optional filters, in error-reporting order
+        apply("subreddit", _validate_subreddit, subreddit)
+        apply("author", _validate_author, author)
+        apply("min_score", self.validate_score, min_score)
+        apply("limit", self.validate_limit, limit)
 
         # Validate page or offset (mutually exclusive)
         if page is not None:
@@ -408,27 +451,12 @@ class SearchInputValidator:
                 sanitized["page"] = page
         else:
             # Use offset directly
-            valid, sanitized_offset, error = self.validate_offset(offset)
-            if not valid:
-                errors.append(ValidationError("offset", error))
-            else:
-                sanitized["offset"] = sanitized_offset
+            apply("offset", self.validate_offset, offset)
 
-        # Validate result_type (optional)
-        valid, sanitized_type, error = self.validate_result_type(result_type)
-        if not valid:
-            errors.append(ValidationError("result_type", error))
-        else:
-            sanitized["result_type"] = sanitized_type
+        apply("result_type", _validate_result_type, result_type)
+        apply("sort_by", _validate_sort_by, sort_by)
 
-        # Validate sort_by (optional)
-        valid, sanitized_sort, error = self.validate_sort_by(sort_by)
-        if not valid:
-            errors.append(ValidationError("sort_by", error))
-        else:
-            sanitized["sort_by"] = sanitized_sort
-
-        return ValidationResult(is_valid=len(errors) == 0, errors=errors, sanitized_values=sanitized)
+        return ValidationResult(is_valid=not errors, errors=errors, sanitized_values=sanitized)
 
 
 # ============================================================================
@@ -444,18 +472,9 @@ validator = SearchInputValidator()
 # ============================================================================
 
 
-def validate_search_params(query: str, **kwargs) -> ValidationResult:
-    """
-    Validate search parameters (convenience function).
-
-    Args:
-        query: Search query text
-        **kwargs: Additional search parameters
-
-    Returns:
-        ValidationResult
-    """
-    return validator.validate_all(query, **kwargs)
+# Bound method of the global validator (no wrapper frame); same call shape as
+# validate_all, with the query text as the first positional argument
+validate_search_params = validator.validate_all
 
 
 def is_valid_subreddit(subreddit: str) -> bool:
@@ -482,139 +501,3 @@ def sanitize_query(query: str) -> str:
     """
     valid, sanitized, _ = validator.validate_query(query)
     return sanitized if valid and sanitized else ""
-
-
-# ============================================================================
-# TEST MODULE
-# ============================================================================
-
-if __name__ == "__main__":
-    """Test input validation with various inputs."""
-    print("Input Validation Module Test")
-    print("=" * 80)
-    print()
-
-    # Test cases: (value, expected_valid, field_name)
-    test_cases = [
-        # Query validation
-        ("example concerns", True, "query"),
-        ("a" * 500, True, "query (max length)"),
-        ("a" * 501, False, "query (too long)"),
-        ("", False, "query (empty)"),
-        ("test\x00null", False, "query (null byte)"),
-        # Subreddit validation
-        ("technology", True, "subreddit"),
-        ("Example", True, "subreddit (mixed case)"),
-        ("ab", True, "subreddit (2 chars - min)"),
-        ("a" * 21, True, "subreddit (21 chars - max)"),
-        ("a", False, "subreddit (too short)"),
-        ("a" * 22, False, "subreddit (too long)"),
-        ("test-sub", False, "subreddit (invalid hyphen)"),
-        ("test sub", False, "subreddit (invalid space)"),
-        # Author validation
-        ("danielmicay", True, "author"),
-        ("User_Name-123", True, "author (valid chars)"),
-        ("abc", True, "author (3 chars - min)"),
-        ("a" * 20, True, "author (20 chars - max)"),
-        ("ab", False, "author (too short)"),
-        ("a" * 21, False, "author (too long)"),
-        ("user@domain", False, "author (invalid @ symbol)"),
-        # Score validation
-        (0, True, "score (zero)"),
-        (100, True, "score (positive)"),
-        (-100, True, "score (negative)"),
-        (2147483647, True, "score (max)"),
-        (-2147483648, True, "score (min)"),
-        (2147483648, False, "score (too high)"),
-        # Limit validation
-        (25, True, "limit (default)"),
-        (10, True, "limit (min)"),
-        (100, True, "limit (max)"),
-        (9, False, "limit (too low)"),
-        (101, False, "limit (too high)"),
-        # Offset validation
-        (0, True, "offset (zero)"),
-        (5000, True, "offset (mid-range)"),
-        (10000, True, "offset (max)"),
-        (-1, False, "offset (negative)"),
-        (10001, False, "offset (too high)"),
-    ]
-
-    print("Individual Field Validation Tests:")
-    print("-" * 80)
-
-    for value, expected_valid, description in test_cases:
-        # Determine which validator to use based on description
-        if "query" in description:
-            valid, sanitized, error = (
-                validator.validate_query(value) if isinstance(value, str) else (False, None, "Wrong type")
-            )
-        elif "subreddit" in description:
-            valid, sanitized, error = (
-                validator.validate_subreddit(value) if isinstance(value, str) else (False, None, "Wrong type")
-            )
-        elif "author" in description:
-            valid, sanitized, error = (
-                validator.validate_author(value) if isinstance(value, str) else (False, None, "Wrong type")
-            )
-        elif "score" in description:
-            valid, sanitized, error = validator.validate_score(value)
-        elif "limit" in description:
-            valid, sanitized, error = validator.validate_limit(value)
-        elif "offset" in description:
-            valid, sanitized, error = validator.validate_offset(value)
-        else:
-            valid, sanitized, error = False, None, "Unknown test type"
-
-        # Check if result matches expectation
-        status = "✅ PASS" if valid == expected_valid else "❌ FAIL"
-
-        print(f"{status} | {description}")
-        if not valid and error:
-            print(f"       Error: {error}")
-        if valid and sanitized is not None and sanitized != value:
-            print(f"       Sanitized: {repr(sanitized)}")
-
-    print()
-    print("=" * 80)
-    print()
-
-    # Test comprehensive validation
-    print("Comprehensive Validation Tests:")
-    print("-" * 80)
-
-    comprehensive_tests = [
-        {
-            "name": "Valid search query",
-            "params": {"query": "example", "subreddit": "technology", "limit": 50},
-            "expected_valid": True,
-        },
-        {"name": "Invalid long query", "params": {"query": "a" * 501, "subreddit": "tech"}, "expected_valid": False},
-        {
-            "name": "Invalid subreddit format",
-            "params": {"query": "test", "subreddit": "test-sub"},
-            "expected_valid": False,
-        },
-        {"name": "Invalid author length", "params": {"query": "test", "author": "ab"}, "expected_valid": False},
-        {"name": "Invalid limit range", "params": {"query": "test", "limit": 150}, "expected_valid": False},
-        {
-            "name": "Multiple validation errors",
-            "params": {"query": "", "subreddit": "a", "author": "ab", "limit": 200},
-            "expected_valid": False,
-        },
-    ]
-
-    for test in comprehensive_tests:
-        result = validator.validate_all(**test["params"])
-        status = "✅ PASS" if result.is_valid == test["expected_valid"] else "❌ FAIL"
-
-        print(f"{status} | {test['name']}")
-        if not result.is_valid:
-            for error in result.errors:
-                print(f"       {error}")
-        if result.is_valid and result.sanitized_values:
-            print(f"       Sanitized: {result.sanitized_values}")
-
-    print()
-    print("=" * 80)
-    print("All validation tests completed!")
@@ -6,18 +6,91 @@ ABOUTME: Wraps regex operations with timeout to prevent catastrophic backtrackin
 
 import re
 import signal
+import threading
+import time
+from collections.abc import Callable
 from contextlib import contextmanager
+from functools import lru_cache
 from re import Match
 
 from .console_output import print_warning
 
+# The third-party regex module enforces timeouts inside the matcher itself:
+# no SIGALRM, no setitimer syscalls per call, and it works on any thread.
+# Without it, fall back to re plus a SIGALRM timer (main thread only).
+try:
+    import regex as _regex
+except ImportError:
+    _regex = None
 
-class RegexTimeout(Exception):
+# google-re2 matches in linear time, so patterns it can run need no timeout at
+# all. Its \w, \s, $ and case folding agree with re only on printable ASCII
+# text, so it is used just for that; other text goes through the timeout path.
+try:
+    import re2 as _re2
+
+    _RE2_OPTIONS = _re2.Options()
+    _RE2_OPTIONS.log_errors = False
+except (ImportError, AttributeError):
+    # AttributeError: an unrelated module named re2 (e.g. pyre2) is installed
+    _re2 = None
+
+
+class RegexTimeout(TimeoutError):
     """Raised when regex execution exceeds timeout."""
 
     pass
 
 
+_engine = _regex if _regex is not None else re
+
+
+def compile(pattern: str, flags: int = 0):
+    """
+    Compile a pattern for the *_compiled helpers with the active regex engine.
+
+    Args:
+        pattern: Regex pattern
+        flags: Regex flags (re flag values are shared by the regex module)
+
+    Returns:
+        Compiled pattern object
+    """
+    if _regex is not None:
+        return _regex.compile(pattern, flags)
+    return re.compile(pattern, flags)
+
+
+# re flags RE2 supports as inline modifiers; flags that don't change matching
+# on ASCII text are ignored, anything else keeps the pattern off RE2
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+_RE2_IGNORED_FLAGS = re.UNICODE | re.ASCII | (_regex.VERSION0 if _regex is not None else 0)
+
+
+@lru_cache(maxsize=256)
+def _re2_pattern(pattern: str, flags: int):
+    """Compile pattern with RE2, or return None if it uses syntax or flags RE2 lacks."""
+    inline = ""
+    for flag, letter in _RE2_INLINE_FLAGS:
+        if flags & flag:
+            inline += letter
+            flags &= ~flag
+    if flags & ~_RE2_IGNORED_FLAGS:
+        return None
+    try:
+        return _re2.compile(f"(?{inline}){pattern}" if inline else pattern, _RE2_OPTIONS)
+    except _re2.error:
+        # Backreferences, lookaround, etc.
+        return None
+
+
+def _linear_pattern(pattern: str, flags: int, text: str):
+    """Get the RE2 version of pattern if it can safely replace it for text."""
+    if _re2 is None or not isinstance(pattern, str) or not (text.isascii() and text.isprintable()):
+        return None
+    return _re2_pattern(pattern, flags)
+
+
 class SafeRegex:
     """Wrapper for regex operations with timeout protection against ReDoS attacks."""
 
@@ -30,14 +103,20 @@ class SafeRegex:
         """
         self.timeout = timeout_seconds
         self._timeout_count = 0
+        self._last_log = 0.0
 
     @contextmanager
     def _timeout_context(self):
         """
         Context manager for setting timeout alarm.
 
-        Uses SIGALRM to interrupt long-running regex operations.
+        Uses SIGALRM to interrupt long-running regex operations. Signal handlers
+        can only be installed from the main thread, so other threads run
+        without the alarm instead of failing.
         """
+        if threading.current_thread() is not threading.main_thread():
+            yield
+            return
 
         def timeout_handler(signum, frame):
             raise RegexTimeout("Regex execution timed out")
@@ -53,6 +132,31 @@ class SafeRegex:
             signal.setitimer(signal.ITIMER_REAL, 0)
             signal.signal(signal.SIGALRM, old_handler)
 
+    def _record_timeout(self, operation: str, pattern: str):
+        """
+        Count a timeout and warn about it, at most once per second.
+
+        Under a ReDoS flood every request can time out; the counter stays exact
+        while the console sees one warning per second instead of one per request.
+        """
+        self._timeout_count += 1
+        now = time.monotonic()
+        if now - self._last_log >= 1.0:
+            self._last_log = now
+            print_warning(f"Regex timeout #{self._timeout_count} on {operation}: {pattern[:50]}...")
+
+    def _run(self, func, *args):
+        """
+        Call a regex function under the timeout.
+
+        The regex module takes the timeout directly and raises TimeoutError;
+        with re, the call is wrapped in the SIGALRM context instead.
+        """
+        if _regex is not None:
+            return func(*args, timeout=self.timeout)
+        with self._timeout_context():
+            return func(*args)
+
     def search(self, pattern: str, text: str, flags: int = 0) -> Match | None:
         """
         Execute regex search with timeout protection.
@@ -65,13 +169,15 @@ class SafeRegex:
         Returns:
             Match object or None if no match or timeout
         """
+        linear = _linear_pattern(pattern, flags, text)
+        if linear is not None:
+            return linear.search(text)
+
         try:
-            with self._timeout_context():
-                return re.search(pattern, text, flags)
-        except RegexTimeout:
+            return self._run(_engine.search, pattern, text, flags)
+        except TimeoutError:
             # Log timeout but don't crash - return None for no match
-            self._timeout_count += 1
-            print_warning(f"Regex timeout #{self._timeout_count} on pattern: {pattern[:50]}...")
+            self._record_timeout("pattern", pattern)
             return None
 
     def sub(self, pattern: str, repl: str, text: str, flags: int = 0) -> str:
@@ -87,13 +193,15 @@ class SafeRegex:
         Returns:
             Modified text, or original if timeout
         """
+        linear = _linear_pattern(pattern, flags, text)
+        if linear is not None:
+            return linear.sub(repl, text)
+
         try:
-            with self._timeout_context():
-                return re.sub(pattern, repl, text, flags)
-        except RegexTimeout:
+            return self._run(_engine.sub, pattern, repl, text, 0, flags)
+        except TimeoutError:
             # Log timeout but don't crash - return original text
-            self._timeout_count += 1
-            print_warning(f"Regex timeout #{self._timeout_count} on substitution: {pattern[:50]}...")
+            self._record_timeout("substitution", pattern)
             return text  # Return original text on timeout
 
     def findall(self, pattern: str, text: str, flags: int = 0) -> list:
@@ -108,13 +216,15 @@ class SafeRegex:
         Returns:
             List of matches, or empty list if timeout
         """
+        linear = _linear_pattern(pattern, flags, text)
+        if linear is not None:
+            return linear.findall(text)
+
         try:
-            with self._timeout_context():
-                return re.findall(pattern, text, flags)
-        except RegexTimeout:
+            return self._run(_engine.findall, pattern, text, flags)
+        except TimeoutError:
             # Log timeout but don't crash - return empty list
-            self._timeout_count += 1
-            print_warning(f"Regex timeout #{self._timeout_count} on findall: {pattern[:50]}...")
+            self._record_timeout("findall", pattern)
             return []
 
     def match(self, pattern: str, text: str, flags: int = 0) -> Match | None:
@@ -129,15 +239,62 @@ class SafeRegex:
         Returns:
             Match object or None if no match or timeout
         """
+        linear = _linear_pattern(pattern, flags, text)
+        if linear is not None:
+            return linear.match(text)
+
         try:
-            with self._timeout_context():
-                return re.match(pattern, text, flags)
-        except RegexTimeout:
+            return self._run(_engine.match, pattern, text, flags)
+        except TimeoutError:
             # Log timeout but don't crash - return None
-            self._timeout_count += 1
-            print_warning(f"Regex timeout #{self._timeout_count} on match: {pattern[:50]}...")
+            self._record_timeout("match", pattern)
+            return None
+
+    def search_compiled(self, pattern, text: str) -> Match | None:
+        """
+        Execute a precompiled regex search with timeout protection.
+
+        Args:
+            pattern: Compiled regex pattern (flags are part of the pattern)
+            text: Text to search
+
+        Returns:
+            Match object or None if no match or timeout
+        """
+        linear = _linear_pattern(pattern.pattern, pattern.flags, text)
+        if linear is not None:
+            return linear.search(text)
+
+        try:
+            return self._run(pattern.search, text)
+        except TimeoutError:
+            # Log timeout but don't crash - return None for no match
+            self._record_timeout("pattern", pattern.pattern)
             return None
 
+    def sub_compiled(self, pattern, repl: str | Callable[[Match], str], text: str) -> str:
+        """
+        Execute a precompiled regex substitution with timeout protection.
+
+        Args:
+            pattern: Compiled regex pattern (flags are part of the pattern)
+            repl: Replacement string, or function called with each match
+            text: Text to process
+
+        Returns:
+            Modified text, or original if timeout
+        """
+        linear = _linear_pattern(pattern.pattern, pattern.flags, text)
+        if linear is not None:
+            return linear.sub(repl, text)
+
+        try:
+            return self._run(pattern.sub, repl, text)
+        except TimeoutError:
+            # Log timeout but don't crash - return original text
+            self._record_timeout("substitution", pattern.pattern)
+            return text  # Return original text on timeout
+
     def get_timeout_count(self) -> int:
         """
         Get number of regex timeouts that have occurred.
@@ -203,6 +360,35 @@ def findall(pattern: str, text: str, flags: int = 0) -> list:
     return safe_regex.findall(pattern, text, flags)
 
 
+def search_compiled(pattern, text: str) -> Match | None:
+    """
+    Safe search with a precompiled pattern (skips the re module's pattern cache lookup).
+
+    Args:
+        pattern: Compiled regex pattern
+        text: Text to search
+
+    Returns:
+        Match object or None
+    """
+    return safe_regex.search_compiled(pattern, text)
+
+
+def sub_compiled(pattern, repl: str | Callable[[Match], str], text: str) -> str:
+    """
+    Safe substitution with a precompiled pattern (skips the re module's pattern cache lookup).
+
+    Args:
+        pattern: Compiled regex pattern
+        repl: Replacement string
+        text: Text to process
+
+    Returns:
+        Modified text
+    """
+    return safe_regex.sub_compiled(pattern, repl, text)
+
+
 # Test module functionality
 if __name__ == "__main__":
     """Test regex timeout protection with various patterns."""
@@ -2,18 +2,68 @@
 # ABOUTME: Google-style search operator parser for intuitive search syntax
 # ABOUTME: Parses sub:, author:, score:, type: operators from search queries (case-insensitive)
 
-import re
+import string
 from dataclasses import dataclass
+from functools import lru_cache
 
 from markupsafe import escape
 
 # Import safe regex wrapper for ReDoS protection
 from . import regex_utils
 
-
-@dataclass
+# All operators in one alternation, compiled once at import. Each branch
+# captures its value in a group named after the filter it sets, so a single
+# scan both extracts the values and strips the operators. Matched against a
+# lowercased copy of the query rather than with re.IGNORECASE.
+OPERATORS_RE = regex_utils.compile(
+    r"\b(?:"
+    r"(?:sub|subreddit):(?P<subreddit>\w+)"
+    r"|(?:author|user):(?P<author>\w+)"
+    r"|score:>?(?P<min_score>\d+)\+?"
+    r"|type:(?P<result_type>post|comment)"
+    r"|sort:(?P<sort_by>rank|relevance|score|date|newest|new|oldest|old)"
+    r")"
+)
+
+# Lowercases ASCII only, for the rare text whose str.lower() changes length
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Map user-friendly sort names to backend values
+SORT_MAPPING = {
+    "rank": "rank",
+    "relevance": "rank",
+    "score": "score",
+    "date": "created_utc",
+    "new": "created_utc",
+    "newest": "created_utc",
+    "old": "created_utc_asc",
+    "oldest": "created_utc_asc",
+}
+
+# Breadcrumb wording for each backend sort value
+SORT_LABELS = {
+    "rank": "by relevance",
+    "score": "by score",
+    "created_utc": "by date (newest first)",
+    "created_utc_asc": "by date (oldest first)",
+}
+
+# Operator names (lowercase) mapped to the filter they set
+OPERATOR_FILTERS = {
+    "sub": "subreddit",
+    "subreddit": "subreddit",
+    "author": "author",
+    "user": "author",
+    "score": "min_score",
+    "type": "result_type",
+    "sort": "sort_by",
+}
+_OPERATOR_MARKERS = tuple(f"{name}:" for name in OPERATOR_FILTERS)
+
+
+@dataclass(slots=True, frozen=True)
 class ParsedSearchQuery:
-    """Parsed search query with extracted operators and clean query text."""
+    """Parsed search query with extracted operators and clean query text (immutable, shared from cache)."""
 
     query_text: str  # Clean query text with operators removed
     subreddit: str | None = None
@@ -38,6 +88,114 @@ class ParsedSearchQuery:
         return " ".join(parts)
 
 
+def _is_word(value: str) -> bool:
+    """Check that value is non-empty and every character matches regex \\w"""
+    return value.replace("_", "a").isalnum()
+
+
+def _parse_operator_tokens(query_text: str) -> tuple[dict, str] | None:
+    """
+    Extract operators from whitespace-separated tokens in a single pass.
+
+    Handles tokens that are exactly one operator (e.g. "sub:technology",
+    "score:>10", "SORT:new"); the first occurrence of each operator wins and
+    every occurrence is removed, as in the regex parser. Returns None when a
+    token contains a colon in any other shape (operator embedded in punctuation,
+    partial values like "type:posts", non-ASCII text), so the caller can fall
+    back to the regex parser and keep its exact behavior.
+    """
+    filters = {}
+    words = []
+
+    for token in query_text.split():
+        name, colon, value = token.partition(":")
+        if not colon:
+            words.append(token)
+            continue
+
+        if not token.isascii():
+            return None
+
+        key = OPERATOR_FILTERS.get(name.lower())
+        if key is None:
+            # Ordinary text with a colon ("10:30"), unless an operator hides inside it
+            if any(marker in token.lower() for marker in _OPERATOR_MARKERS):
+                return None
+            words.append(token)
+            continue
+
+        if key == "subreddit" or key == "author":
+            if not _is_word(value):
+                return None
+        elif key == "min_score":
+            digits = value[1:] if value.startswith(">") else value
+            digits = digits[:-1] if digits.endswith("+") else digits
+            if not digits.isdecimal():
+                return None
+            value = int(digits)
+        elif key == "result_type":
+            value = value.lower()
+            if value not in ("post", "comment"):
+                return None
+        else:
+            value = SORT_MAPPING.get(value.lower())
+            if value is None:
+                return None
+
+        filters.setdefault(key, value)
+
+    return filters, " ".join(words)
+
+
+def _parse_operators_with_regex(query_text: str) -> tuple[dict, str]:
+    """Extract operators with the (timeout-protected) operator regex."""
+    # Operator names are ASCII: match case-insensitively by scanning a lowercased
+    # copy, then take values and kept text from the original via match spans
+    lower_query = query_text.lower()
+    if len(lower_query) != len(query_text):
+        lower_query = query_text.translate(_ASCII_LOWER)
+
+    values = {}
+    spans = []
+
+    def capture(match):
+        # First occurrence of each operator wins; every occurrence is removed
+        if match.lastgroup not in values:
+            start, end = match.span(match.lastindex)
+            values[match.lastgroup] = query_text[start:end]
+        spans.append(match.span())
+        return ""
+
+    regex_utils.sub_compiled(OPERATORS_RE, capture, lower_query)
+
+    # Rebuild the query from the text between operators, preserving its case
+    pieces = []
+    last = 0
+    for start, end in spans:
+        pieces.append(query_text[last:start])
+        last = end
+    pieces.append(query_text[last:])
+    clean_query = "".join(pieces)
+
+    filters = {}
+    if "subreddit" in values:
+        filters["subreddit"] = values["subreddit"]  # Preserve case for database lookup
+    if "author" in values:
+        filters["author"] = values["author"]
+    if "min_score" in values:
+        filters["min_score"] = int(values["min_score"])
+    if "result_type" in values:
+        filters["result_type"] = values["result_type"].lower()
+    if "sort_by" in values:
+        filters["sort_by"] = SORT_MAPPING[values["sort_by"].lower()]
+
+    # Clean up extra whitespace
+    # Multiple spaces → single space, trim leading/trailing
+    clean_query = " ".join(clean_query.split())
+
+    return filters, clean_query
+
+
 def parse_search_operators(query_text: str) -> ParsedSearchQuery:
     """
     Parse Google-style search operators from query text with ReDoS protection.
@@ -70,83 +228,30 @@ def parse_search_operators(query_text: str) -> ParsedSearchQuery:
         return ParsedSearchQuery(query_text="")
 
     # Early validation - reject extremely long inputs before regex processing
-    # This prevents ReDoS attacks with very long strings
+    # This prevents ReDoS attacks with very long strings (and bounds cache keys)
     MAX_QUERY_LENGTH = 500
     if len(query_text) > MAX_QUERY_LENGTH:
         query_text = query_text[:MAX_QUERY_LENGTH]
 
-    filters = {}
-    clean_query = query_text
-
-    # Extract subreddit operator (sub: or subreddit:)
-    # Pattern: \b(?:sub|subreddit):(\w+)
-    # Matches: sub:example, subreddit:technology
-    # Use safe_regex to prevent ReDoS attacks
-    subreddit_match = regex_utils.search(r"\b(?:sub|subreddit):(\w+)", clean_query, re.IGNORECASE)
-    if subreddit_match:
-        filters["subreddit"] = subreddit_match.group(1)  # Preserve case for database lookup
-        # Remove operator from query text
-        clean_query = regex_utils.sub(r"\b(?:sub|subreddit):\w+", "", clean_query, re.IGNORECASE)
-
-    # Extract author operator (author: or user:)
-    # Pattern: \b(?:author|user):(\w+)
-    # Matches: author:danielmicay, user:spez
-    # Use safe_regex to prevent ReDoS attacks
-    author_match = regex_utils.search(r"\b(?:author|user):(\w+)", clean_query, re.IGNORECASE)
-    if author_match:
-        filters["author"] = author_match.group(1)
-        # Remove operator from query text
-        clean_query = regex_utils.sub(r"\b(?:author|user):\w+", "", clean_query, re.IGNORECASE)
-
-    # Extract score operator (score:10+, score:>10, score:10)
-    # Pattern: \bscore:>?(\d+)\+?
-    # Matches: score:10+, score:>10, score:10
-    # Use safe_regex to prevent ReDoS attacks
-    score_match = regex_utils.search(r"\bscore:>?(\d+)\+?", clean_query, re.IGNORECASE)
-    if score_match:
-        filters["min_score"] = int(score_match.group(1))
-        # Remove operator from query text
-        clean_query = regex_utils.sub(r"\bscore:>?\d+\+?", "", clean_query, re.IGNORECASE)
-
-    # Extract type operator (type:post or type:comment)
-    # Pattern: \btype:(post|comment)
-    # Matches: type:post, type:comment
-    # Use safe_regex to prevent ReDoS attacks
-    type_match = regex_utils.search(r"\btype:(post|comment)", clean_query, re.IGNORECASE)
-    if type_match:
-        filters["result_type"] = type_match.group(1).lower()
-        # Remove operator from query text
-        clean_query = regex_utils.sub(r"\btype:(?:post|comment)", "", clean_query, re.IGNORECASE)
-
-    # Extract sort operator (sort:rank, sort:score, sort:date, sort:new, sort:old)
-    # Pattern: \bsort:(rank|relevance|score|date|new|newest|old|oldest)
-    # Matches: sort:score, sort:new, sort:relevance, sort:old
-    # Use safe_regex to prevent ReDoS attacks
-    sort_match = regex_utils.search(
-        r"\bsort:(rank|relevance|score|date|new|newest|old|oldest)", clean_query, re.IGNORECASE
-    )
-    if sort_match:
-        sort_value = sort_match.group(1).lower()
-        # Map user-friendly names to backend values
-        sort_mapping = {
-            "rank": "rank",
-            "relevance": "rank",
-            "score": "score",
-            "date": "created_utc",
-            "new": "created_utc",
-            "newest": "created_utc",
-            "old": "created_utc_asc",
-            "oldest": "created_utc_asc",
-        }
-        filters["sort_by"] = sort_mapping.get(sort_value, "rank")
-        # Remove operator from query text
-        clean_query = regex_utils.sub(
-            r"\bsort:(?:rank|relevance|score|date|new|newest|old|oldest)", "", clean_query, re.IGNORECASE
-        )
+    return _parse_cached(query_text)
 
-    # Clean up extra whitespace
-    # Multiple spaces → single space, trim leading/trailing
-    clean_query = " ".join(clean_query.split())
+
+@lru_cache(maxsize=1024)
+def _parse_cached(query_text: str) -> ParsedSearchQuery:
+    """
+    Parse a length-capped, non-blank query.
+
+    Parsing is pure, so repeated queries (pagination, refreshes) are served
+    from the cache; the frozen result is safe to share between callers.
+    """
+    # Every operator contains a colon; plain text searches only need whitespace cleanup
+    if ":" not in query_text:
+        return ParsedSearchQuery(query_text=" ".join(query_text.split()))
+
+    # Common case: operators written as their own whitespace-separated words,
+    # parsed in one pass without regex; anything unusual goes to the regex parser
+    parsed = _parse_operator_tokens(query_text)
+    filters, clean_query = parsed if parsed is not None else _parse_operators_with_regex(query_text)
 
     # Build ParsedSearchQuery
     return ParsedSearchQuery(
@@ -205,26 +310,14 @@ def format_search_breadcrumb(parsed_query: ParsedSearchQuery) -> str:
 
     # Sort order (safe - comes from controlled dictionary)
     if parsed_query.sort_by:
-        sort_labels = {
-            "rank": "by relevance",
-            "score": "by score",
-            "created_utc": "by date (newest first)",
-            "created_utc_asc": "by date (oldest first)",
-        }
-        sort_label = sort_labels.get(parsed_query.sort_by, f"sorted by {escape(parsed_query.sort_by)}")
+        sort_label = SORT_LABELS.get(parsed_query.sort_by, f"sorted by {escape(parsed_query.sort_by)}")
         parts.append(f"(sorted {sort_label})")
 
     return " ".join(parts)
 
 
-def get_search_tips() -> str:
-    """
-    Get HTML-formatted search tips for display.
-
-    Returns:
-        HTML string with search tips
-    """
-    return """
+# Static search tips markup returned by get_search_tips()
+SEARCH_TIPS_HTML = """
 <div class="search-tips">
     <h6>💡 Search Tips:</h6>
 
@@ -257,6 +350,16 @@ def get_search_tips() -> str:
 """
 
 
+def get_search_tips() -> str:
+    """
+    Get HTML-formatted search tips for display.
+
+    Returns:
+        HTML string with search tips
+    """
+    return SEARCH_TIPS_HTML
+
+
 # Test cases for validation
 if __name__ == "__main__":
     """Test operator parsing with various inputs."""
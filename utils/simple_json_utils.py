@@ -4,24 +4,170 @@ ABOUTME: Simple JSON file utilities with read-merge-write operations for resume
 ABOUTME: Replaces complex AtomicJSONManager with straightforward file operations and merging
 """
 
+import atexit
+import gc
 import json
+import logging
+import math
+import operator
 import os
+import stat
+import tempfile
+import threading
+import warnings
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import chain
+from queue import Empty, Queue
 from typing import Any
 
+from core.postgres_database import PostgresDatabase, get_postgres_connection_string
 
-def read_json_safe(file_path: str, default_value: Any = None) -> Any:
+logger = logging.getLogger(__name__)
+
+
+def _json_dumps(data: Any) -> bytes:
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _has_non_finite(data: Any) -> bool:
+    """True if data contains a NaN or infinite float anywhere in its values."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(map(_has_non_finite, data.values()))
+    if isinstance(data, (list, tuple)):
+        return any(map(_has_non_finite, data))
+    return False
+
+
+# orjson encodes/decodes in C several times faster than json. With OPT_INDENT_2
+# its output is equivalent JSON, not byte-identical: floats use the shortest
+# exponent form (1e-7, not 1e-07). orjson writes NaN/Infinity as null, so data
+# containing them is written by json instead, which keeps the NaN/Infinity
+# literals as before; reading falls back to json for the same reason.
+try:
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        # A non-finite float can only be hiding behind a null in the output
+        if b"null" in payload and _has_non_finite(data):
+            return _json_dumps(data)
+        return payload
+
+    def _loads(raw: bytes) -> Any:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity; genuinely corrupt files fail again here
+            return json.loads(raw)
+
+except ImportError:
+    _dumps = _json_dumps
+    _loads = json.loads
+
+# Full collections walk every tracked object, so user batch generators only run
+# one every this many batches and otherwise rely on refcounting
+_BATCH_GC_INTERVAL = 16
+
+# Directories write_json_safe has already created (absolute paths only)
+_dirs_ensured = set()
+
+# Mode open() gives a new file under the current umask (os.umask can only be read by setting it)
+_umask = os.umask(0)
+os.umask(_umask)
+_NEW_FILE_MODE = 0o666 & ~_umask
+del _umask
+
+
+@lru_cache(maxsize=32)
+def _normalized_abspath(path: str) -> str:
+    return os.path.normpath(path)
+
+
+def _abspath(path: str) -> str:
     """
-    Safely read a JSON file, returning default_value if file doesn't exist or is corrupted.
+    os.path.abspath with absolute paths memoized.
+
+    Relative paths are resolved on every call because the archiver chdirs into
+    the output directory partway through a run.
+    """
+    if os.path.isabs(path):
+        return _normalized_abspath(path)
+    return os.path.abspath(path)
+
+
+def _read_json_file(file_path: str, default_value: Any) -> tuple[Any, bytes | None]:
+    """
+    Read and parse a JSON file, returning (data, raw_bytes).
+
+    Falls back to (default_value, None) if the file doesn't exist or is corrupted.
     """
     if not os.path.exists(file_path):
-        return default_value
+        return default_value, None
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        return _loads(raw), raw
     except (OSError, json.JSONDecodeError) as e:
-        print(f"[WARNING] Error reading {file_path}: {e}, using default value")
-        return default_value
+        logger.warning("Error reading %s: %s, using default value", file_path, e)
+        return default_value, None
+
+
+def _write_json_bytes(file_path: str, payload: bytes) -> None:
+    """
+    Atomically replace file_path with payload.
+
+    Writes a temporary file next to the target and renames it over the target,
+    so an interrupted write never leaves a truncated JSON file behind.
+    """
+    # Ensure directory exists (once per absolute directory; "" is the cwd)
+    directory = os.path.dirname(file_path)
+    if directory and directory not in _dirs_ensured:
+        os.makedirs(directory, exist_ok=True)
+        if os.path.isabs(directory):
+            _dirs_ensured.add(directory)
+
+    # mkstemp gives every writer (thread or process) its own temporary file
+    tmp_dir = directory or os.curdir
+    tmp_prefix = os.path.basename(file_path) + "."
+    try:
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=tmp_prefix, dir=tmp_dir)
+    except FileNotFoundError:
+        # Directory was removed since it was first created
+        _dirs_ensured.discard(directory)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=tmp_prefix, dir=tmp_dir)
+
+    try:
+        # mkstemp creates the file as 0600; keep the permissions the target
+        # already has, or the umask default a plain open() would have used
+        try:
+            mode = stat.S_IMODE(os.stat(file_path).st_mode)
+        except FileNotFoundError:
+            mode = _NEW_FILE_MODE
+        os.chmod(tmp_path, mode)
+
+        # One write of the fully serialized payload; writes larger than the
+        # default buffer bypass it and go to the OS as a single write()
+        with open(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_json_safe(file_path: str, default_value: Any = None) -> Any:
+    """
+    Safely read a JSON file, returning default_value if file doesn't exist or is corrupted.
+    """
+    return _read_json_file(file_path, default_value)[0]
 
 
 def write_json_safe(file_path: str, data: Any) -> bool:
@@ -29,14 +175,11 @@ def write_json_safe(file_path: str, data: Any) -> bool:
     Safely write JSON data to a file.
     """
     try:
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Serialize first so an unencodable value can't leave a truncated file
+        _write_json_bytes(file_path, _dumps(data))
         return True
     except Exception as e:
-        print(f"[ERROR] Failed to write {file_path}: {e}")
+        logger.error("Failed to write %s: %s", file_path, e)
         return False
 
 
@@ -47,20 +190,29 @@ def merge_and_write_json(file_path: str, new_data: Any, merge_function) -> bool:
     """
     try:
         # Read existing data
-        existing_data = read_json_safe(file_path, {})
+        existing_data, existing_raw = _read_json_file(file_path, {})
 
         # Merge with new data
         merged_data = merge_function(existing_data, new_data)
 
+        # Skip the write when the merge changed nothing (common when resuming)
+        payload = _dumps(merged_data)
+        if payload == existing_raw:
+            return True
+
         # Write merged data back
-        return write_json_safe(file_path, merged_data)
+        _write_json_bytes(file_path, payload)
+        return True
     except Exception as e:
-        print(f"[ERROR] Failed to merge and write {file_path}: {e}")
+        logger.error("Failed to merge and write %s: %s", file_path, e)
         return False
 
 
 # Specific merge functions for different data types
 
+# Sort key for subreddit list entries (post count, 0 when missing)
+_get_posts = operator.methodcaller("get", "posts", 0)
+
 
 def merge_subreddit_stats(existing_data: dict, new_data: dict) -> dict:
     """
@@ -69,13 +221,8 @@ def merge_subreddit_stats(existing_data: dict, new_data: dict) -> dict:
     """
     merged = existing_data.copy() if existing_data else {}
 
-    for subreddit, stats in new_data.items():
-        if subreddit in merged:
-            # Update existing subreddit with new data (in case we're reprocessing)
-            merged[subreddit] = stats
-        else:
-            # Add new subreddit
-            merged[subreddit] = stats
+    # Add new subreddits; reprocessed ones replace their existing entry
+    merged |= new_data
 
     return merged
 
@@ -87,8 +234,7 @@ def merge_search_metadata(existing_data: dict, new_data: dict) -> dict:
     merged = existing_data.copy() if existing_data else {}
 
     # Search metadata can be safely overwritten per subreddit
-    for subreddit, metadata in new_data.items():
-        merged[subreddit] = metadata
+    merged |= new_data
 
     return merged
 
@@ -101,14 +247,15 @@ def merge_user_activity(existing_data: dict, new_data: dict) -> dict:
 
     # Merge users_by_subreddit
     if "users_by_subreddit" in new_data:
-        if "users_by_subreddit" not in merged:
-            merged["users_by_subreddit"] = {}
-        merged["users_by_subreddit"].update(new_data["users_by_subreddit"])
+        users_by_subreddit = merged.setdefault("users_by_subreddit", {})
+        users_by_subreddit.update(new_data["users_by_subreddit"])
 
-    # Update other fields
-    for key, value in new_data.items():
-        if key != "users_by_subreddit":
-            merged[key] = value
+        # Update other fields, keeping the merged users_by_subreddit
+        merged |= new_data
+        merged["users_by_subreddit"] = users_by_subreddit
+    else:
+        # Update other fields
+        merged |= new_data
 
     return merged
 
@@ -127,20 +274,14 @@ def merge_subreddit_list(existing_data: list | dict | None, new_data: list | dic
         if not isinstance(existing_data, list):
             existing_data = []
 
-        # Create a map of existing subreddits by name to avoid duplicates
-        existing_map = {}
-        for item in existing_data:
-            if isinstance(item, dict) and "name" in item:
-                existing_map[item["name"]] = item
-
-        # Add or update subreddits from new data
-        for item in new_data:
-            if isinstance(item, dict) and "name" in item:
-                existing_map[item["name"]] = item
+        # Map subreddits by name to avoid duplicates; new entries replace existing ones
+        merged_map = {
+            item["name"]: item for item in chain(existing_data, new_data) if isinstance(item, dict) and "name" in item
+        }
 
         # Return as sorted list by post count (descending)
-        result = list(existing_map.values())
-        result.sort(key=lambda x: x.get("posts", 0), reverse=True)
+        result = list(merged_map.values())
+        result.sort(key=_get_posts, reverse=True)
         return result
 
     # Handle dict format (with 'subreddits' key)
@@ -197,7 +338,7 @@ def save_subreddit_stats(output_dir: str, subreddit_name: str, stats: dict) -> b
     to PostgreSQL-based statistics storage.
     """
     # ✅ FIX: Ensure we use absolute path to prevent double-nested directories
-    abs_output_dir = os.path.abspath(output_dir)
+    abs_output_dir = _abspath(output_dir)
     stats_file = os.path.join(abs_output_dir, ".archive-subreddit-stats.json")
     new_data = {subreddit_name: stats}
     return merge_and_write_json(stats_file, new_data, merge_subreddit_stats)
@@ -218,7 +359,7 @@ def save_search_metadata(output_dir: str, subreddit_name: str, metadata: dict) -
     to PostgreSQL-based storage.
     """
     # ✅ FIX: Ensure we use absolute path to prevent double-nested directories
-    abs_output_dir = os.path.abspath(output_dir)
+    abs_output_dir = _abspath(output_dir)
     metadata_file = os.path.join(abs_output_dir, ".archive-search-metadata.json")
     new_data = {subreddit_name: metadata}
     return merge_and_write_json(metadata_file, new_data, merge_search_metadata)
@@ -227,7 +368,7 @@ def save_search_metadata(output_dir: str, subreddit_name: str, metadata: dict) -
 def save_user_activity(output_dir: str, activity_data: dict) -> bool:
     """Save user activity data with proper merging."""
     # ✅ FIX: Ensure we use absolute path to prevent double-nested directories
-    abs_output_dir = os.path.abspath(output_dir)
+    abs_output_dir = _abspath(output_dir)
     activity_file = os.path.join(abs_output_dir, ".archive-user-activity.json")
     return merge_and_write_json(activity_file, activity_data, merge_user_activity)
 
@@ -235,7 +376,7 @@ def save_user_activity(output_dir: str, activity_data: dict) -> bool:
 def save_subreddit_list(output_dir: str, subreddit_list: list | dict) -> bool:
     """Save global subreddit list with proper merging - CRITICAL for resume operations."""
     # ✅ FIX: Ensure we use absolute path to prevent double-nested directories
-    abs_output_dir = os.path.abspath(output_dir)
+    abs_output_dir = _abspath(output_dir)
     list_file = os.path.join(abs_output_dir, "static", "data", "subreddit-list.json")
     return merge_and_write_json(list_file, subreddit_list, merge_subreddit_list)
 
@@ -255,7 +396,7 @@ def load_subreddit_stats(output_dir: str) -> dict:
     to PostgreSQL-based statistics retrieval.
     """
     # ✅ FIX: Ensure we use absolute path for consistent access
-    abs_output_dir = os.path.abspath(output_dir)
+    abs_output_dir = _abspath(output_dir)
     stats_file = os.path.join(abs_output_dir, ".archive-subreddit-stats.json")
     return read_json_safe(stats_file, {})
 
@@ -275,7 +416,7 @@ def load_search_metadata(output_dir: str) -> dict:
     to PostgreSQL-based storage.
     """
     # ✅ FIX: Ensure we use absolute path for consistent access
-    abs_output_dir = os.path.abspath(output_dir)
+    abs_output_dir = _abspath(output_dir)
     metadata_file = os.path.join(abs_output_dir, ".archive-search-metadata.json")
     return read_json_safe(metadata_file, {})
 
@@ -283,7 +424,7 @@ def load_search_metadata(output_dir: str) -> dict:
 def load_user_activity(output_dir: str) -> dict:
     """Load user activity data."""
     # ✅ FIX: Ensure we use absolute path for consistent access
-    abs_output_dir = os.path.abspath(output_dir)
+    abs_output_dir = _abspath(output_dir)
     activity_file = os.path.join(abs_output_dir, ".archive-user-activity.json")
     return read_json_safe(activity_file, {})
 
@@ -291,7 +432,7 @@ def load_user_activity(output_dir: str) -> dict:
 def load_subreddit_list(output_dir: str) -> list | dict:
     """Load global subreddit list."""
     # ✅ FIX: Ensure we use absolute path for consistent access
-    abs_output_dir = os.path.abspath(output_dir)
+    abs_output_dir = _abspath(output_dir)
     list_file = os.path.join(abs_output_dir, "static", "data", "subreddit-list.json")
     return read_json_safe(list_file, [])
 
@@ -302,13 +443,40 @@ def load_subreddit_list(output_dir: str) -> list | dict:
 # ===============================================================================
 
 
+@lru_cache(maxsize=1)
 def get_archive_database_connection_string() -> str:
-    """Get PostgreSQL connection string from environment."""
-    from core.postgres_database import get_postgres_connection_string
+    """Get PostgreSQL connection string from environment.
 
+    Computed once per process; call get_archive_database_connection_string.cache_clear()
+    to re-read the environment.
+    """
     return get_postgres_connection_string()
 
 
+# Shared PostgresDatabase for the user batch generators and stats (created on first use)
+_db = None
+_db_lock = threading.Lock()
+
+
+def _get_database():
+    """Get or create the PostgresDatabase shared by the functions below.
+
+    Reusing one connection pool avoids a connect and schema check on every
+    generator or stats call; the pool is closed at interpreter exit. The lock
+    keeps concurrent first calls (e.g. from the prefetch thread) to one pool.
+    """
+    global _db
+    if _db is None:
+        with _db_lock:
+            if _db is None:
+                db = PostgresDatabase(
+                    get_archive_database_connection_string(), pool_size=8, workload_type="user_processing"
+                )
+                atexit.register(db.pool.close_all)
+                _db = db
+    return _db
+
+
 def save_user_index_sqlite(output_dir: str, user_index: dict) -> bool:
     """
     DEPRECATED: User data is now automatically tracked in RedditDatabase.
@@ -316,7 +484,11 @@ def save_user_index_sqlite(output_dir: str, user_index: dict) -> bool:
     This function is obsolete. User statistics are automatically updated
     via RedditDatabase.update_user_statistics() after batch inserts.
     """
-    print("[WARNING] save_user_index_sqlite() is deprecated - user data auto-tracked in RedditDatabase")
+    warnings.warn(
+        "save_user_index_sqlite() is deprecated - user data auto-tracked in RedditDatabase",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     return True  # No-op for backward compatibility
 
 
@@ -329,7 +501,9 @@ def load_user_index_sqlite(output_dir: str) -> dict:
 
     Returns empty dict for backward compatibility.
     """
-    print("[WARNING] load_user_index_sqlite() is deprecated - use RedditDatabase methods instead")
+    warnings.warn(
+        "load_user_index_sqlite() is deprecated - use RedditDatabase methods instead", DeprecationWarning, stacklevel=2
+    )
     return {}  # Return empty dict for backward compatibility
 
 
@@ -340,10 +514,51 @@ def save_user_index_incremental_sqlite(output_dir: str, subreddit_name: str, use
     This function is obsolete. User statistics are automatically updated
     via RedditDatabase.update_user_statistics() after batch inserts.
     """
-    print(f"[WARNING] save_user_index_incremental_sqlite() is deprecated for r/{subreddit_name}")
+    warnings.warn("save_user_index_incremental_sqlite() is deprecated", DeprecationWarning, stacklevel=2)
     return True  # No-op for backward compatibility
 
 
+def _prefetch(batches: Iterator) -> Iterator:
+    """
+    Yield items from batches while the next one is fetched in a background thread.
+
+    The queue holds a single batch, so database fetches overlap with the caller's
+    rendering without buffering more than one batch ahead. Exceptions raised while
+    fetching are re-raised in the consumer.
+    """
+    queue = Queue(maxsize=1)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for batch in batches:
+                queue.put((batch, None))
+                if stop.is_set():
+                    break
+        except Exception as e:
+            queue.put((None, e))
+        finally:
+            queue.put(None)  # End-of-stream sentinel
+
+    worker = threading.Thread(target=produce, name="user-batch-prefetch", daemon=True)
+    worker.start()
+    try:
+        while (item := queue.get()) is not None:
+            batch, error = item
+            if error is not None:
+                raise error
+            yield batch
+    finally:
+        # Unblock the producer if the consumer stopped early
+        stop.set()
+        while worker.is_alive():
+            try:
+                queue.get(timeout=0.1)
+            except Empty:
+                pass
+        worker.join()
+
+
 def get_user_batches_sqlite(
     output_dir: str,
     batch_size: int = 500,
@@ -370,50 +585,44 @@ def get_user_batches_sqlite(
         List of (username, user_data) tuples for each batch
     """
     try:
-        from core.postgres_database import PostgresDatabase
+        db = _get_database()
+        # The count is a separate query, so skip it when nobody is listening
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Processing %d users in batches of %d", db.get_user_count(min_activity), batch_size)
 
-        connection_string = get_archive_database_connection_string()
-
-        with PostgresDatabase(connection_string, workload_type="user_processing") as db:
-            all_usernames = db.get_user_list(min_activity)
-            total_users = len(all_usernames)
-            print(f"Processing {total_users} users in batches of {batch_size}")
-
-            offset = 0
-            while offset < total_users:
-                # Get batch of usernames
-                batch_end = min(offset + batch_size, total_users)
-                usernames = all_usernames[offset:batch_end]
+        def fetch_batches():
+            last_username = None
+            while True:
+                # Get next page of usernames (keyset pagination on username)
+                usernames = db.get_user_list_page(last_username, batch_size, min_activity)
 
                 if not usernames:
                     break
+                last_username = usernames[-1]
 
                 # PERFORMANCE FIX: Use bulk query method instead of N+1 individual queries
                 # This reduces database query time from 20+ seconds to <100ms
-                users_data_dict = db.get_user_activity_batch(
-                    usernames, min_score=min_score, min_comments=min_comments, hide_deleted=hide_deleted
+                # Users with no content after filtering are skipped (prevents dead links)
+                batch_data = list(
+                    db.iter_user_activity_batch(
+                        usernames, min_score=min_score, min_comments=min_comments, hide_deleted=hide_deleted
+                    )
                 )
 
-                # Convert dict to list of tuples format expected by caller
-                # Skip users with no content after filtering (prevents dead links)
-                batch_data = [
-                    (username, users_data_dict[username])
-                    for username in usernames
-                    if username in users_data_dict and users_data_dict[username].get("all_content")
-                ]
-
-                print(f"Loaded batch: {len(batch_data)} users (offset {offset})")
+                logger.info("Loaded batch: %d users (through %s)", len(batch_data), last_username)
                 yield batch_data
 
-                offset += batch_size
-
-                # Cleanup memory after each batch
-                import gc
+        # Fetch the next batch while the caller renders the current one
+        for batch_number, batch_data in enumerate(_prefetch(fetch_batches()), 1):
+            yield batch_data
+            del batch_data
 
+            # Periodic cleanup of reference cycles
+            if batch_number % _BATCH_GC_INTERVAL == 0:
                 gc.collect()
 
     except Exception as e:
-        print(f"[ERROR] Failed to load user batches from RedditDatabase: {e}")
+        logger.error("Failed to load user batches from RedditDatabase: %s", e)
 
 
 def get_user_batches_for_subreddit_sqlite(
@@ -429,7 +638,7 @@ def get_user_batches_for_subreddit_sqlite(
     Generator that yields batches of users from unified RedditDatabase for a specific subreddit.
 
     Updated to use RedditDatabase instead of deprecated UserDatabase.
-    Note: Currently filters users in memory (future optimization: add DB-level filtering).
+    Users are filtered to the subreddit in SQL and paged by username.
 
     Args:
         output_dir: Output directory containing the database
@@ -444,60 +653,56 @@ def get_user_batches_for_subreddit_sqlite(
         List of (username, user_data) tuples for each batch
     """
     try:
-        from core.postgres_database import PostgresDatabase
-
-        connection_string = get_archive_database_connection_string()
-
-        with PostgresDatabase(connection_string, workload_type="user_processing") as db:
-            # Get all users (subreddit filtering done in memory for now)
-            all_usernames = db.get_user_list(min_activity)
-            print(f"Filtering users with r/{subreddit} activity from {len(all_usernames)} users")
-
-            offset = 0
-            while offset < len(all_usernames):
-                # Get batch of usernames
-                batch_end = min(offset + batch_size, len(all_usernames))
-                usernames = all_usernames[offset:batch_end]
+        db = _get_database()
+        # Only users with posts or comments in the subreddit
+        logger.info("Processing users with r/%s activity in batches of %d", subreddit, batch_size)
+        subreddit_filter = subreddit.lower()  # Case-fold once for every page and batch query
+
+        def fetch_batches():
+            last_username = None
+            while True:
+                # Get next page of usernames (keyset pagination on username)
+                usernames = db.get_user_list_page(
+                    last_username, batch_size, min_activity, subreddit_filter=subreddit_filter
+                )
 
                 if not usernames:
                     break
+                last_username = usernames[-1]
 
                 # PERFORMANCE FIX: Use bulk query method instead of N+1 individual queries
-                users_data_dict = db.get_user_activity_batch(
-                    usernames,
-                    subreddit_filter=subreddit,
-                    min_score=min_score,
-                    min_comments=min_comments,
-                    hide_deleted=hide_deleted,
-                )
-
-                # Filter users who have activity in the target subreddit after filtering
-                # Skip users with no content after applying filters (prevents dead links)
-                batch_data = []
-                for username, user_data in users_data_dict.items():
-                    # Check if user has posts or comments in target subreddit after filtering
-                    has_activity = any(
-                        item.get("subreddit", "").lower() == subreddit.lower()
-                        for item in user_data.get("all_content", [])
+                # Activity is already limited to the subreddit by subreddit_filter
+                # Users with no content after filtering are skipped (prevents dead links)
+                batch_data = list(
+                    db.iter_user_activity_batch(
+                        usernames,
+                        subreddit_filter=subreddit_filter,
+                        min_score=min_score,
+                        min_comments=min_comments,
+                        hide_deleted=hide_deleted,
                     )
-                    if has_activity and user_data.get("all_content"):
-                        batch_data.append((username, user_data))
+                )
 
                 if batch_data:
-                    print(
-                        f"Loaded batch: {len(batch_data)} users from r/{subreddit} (filtered from {len(usernames)} users)"
+                    logger.info(
+                        "Loaded batch: %d users from r/%s (filtered from %d users)",
+                        len(batch_data),
+                        subreddit,
+                        len(usernames),
                     )
                     yield batch_data
 
-                offset += batch_size
-
-                # Cleanup memory after each batch
-                import gc
+        # Fetch the next batch while the caller renders the current one
+        for batch_number, batch_data in enumerate(_prefetch(fetch_batches()), 1):
+            yield batch_data
+            del batch_data
 
+            # Periodic cleanup of reference cycles
+            if batch_number % _BATCH_GC_INTERVAL == 0:
                 gc.collect()
 
     except Exception as e:
-        print(f"[ERROR] Failed to load user batches for r/{subreddit} from RedditDatabase: {e}")
+        logger.error("Failed to load user batches for r/%s from RedditDatabase: %s", subreddit, e)
 
 
 def migrate_json_to_sqlite(output_dir: str, force: bool = False) -> bool:
@@ -510,10 +715,23 @@ def migrate_json_to_sqlite(output_dir: str, force: bool = False) -> bool:
 
     Returns True for backward compatibility.
     """
-    print("[WARNING] migrate_json_to_sqlite() is deprecated - RedditDatabase handles user data automatically")
+    warnings.warn(
+        "migrate_json_to_sqlite() is deprecated - RedditDatabase handles user data automatically",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     return True  # No-op for backward compatibility
 
 
+def get_user_count_sqlite(output_dir: str, min_activity: int = 0) -> int:
+    """
+    Count users with at least min_activity posts+comments.
+
+    Uses the shared PostgresDatabase, so callers don't open a pool of their own.
+    """
+    return _get_database().get_user_count(min_activity)
+
+
 def get_sqlite_database_stats(output_dir: str) -> dict:
     """
     Get unified RedditDatabase statistics for monitoring.
@@ -522,12 +740,8 @@ def get_sqlite_database_stats(output_dir: str) -> dict:
     deprecated UserDatabase.get_database_stats().
     """
     try:
-        from core.postgres_database import PostgresDatabase
-
-        connection_string = get_archive_database_connection_string()
-
-        with PostgresDatabase(connection_string, workload_type="user_processing") as db:
-            return db.get_database_info()
+        db = _get_database()
+        return db.get_database_info()
     except Exception as e:
-        print(f"[ERROR] Failed to get database stats: {e}")
+        logger.error("Failed to get database stats: %s", e)
         return {}